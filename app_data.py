@@ -0,0 +1,79 @@
+"""
+Locations of the files that Smiles bundles and the per-user files that it maintains. This module
+doesn't depend on Qt so it can be shared by the GUI and the command line tools.
+
+
+Disclaimer of Warranty
+
+This software is provided "as is," without any warranties of any kind, either express or implied,
+including but not limited to the implied warranties of merchantability, fitness for a particular
+purpose, or non-infringement. The entire risk arising out of the use or performance of the software
+remains with you. In no event shall the software provider be liable for any direct, indirect,
+incidental, special, consequential, or punitive damages whatsoever arising out of or in connection
+with the use or inability to use the software.
+"""
+import os
+import platform
+import json
+
+
+__version__ = "1.0.0"
+__date__ = "Oct '26"
+
+APP_NAME = "Smiles"
+APP_EXT = "rlm"
+BASE_DIR = os.path.dirname(__file__)
+ARTIFACTS_DIR = "artifacts"
+DISTANCES_FILE = "20250218_distances.pdf"
+FORM_FILE = "20250218_mileage.pdf"
+ADDITIONAL_FORM_FILE = "20250218_additional_mileage.pdf"
+DISTANCES_CACHE_FILE = "distances_cache.json"
+FORM_WIDGETS_CACHE_FILE = "form_widgets_cache.json"
+RECOVERY_FILE = "recovery.json"
+ARCHIVE_FILE = "trips.sqlite3"
+HISTORY_FILE = "history.json"
+
+USER_INFO_SETTINGS = ["Name", "Employee Number", "Building/Department", "Account Number"]
+
+
+def get_artifact_path(file_name):
+    """Returns the path to a file that is bundled with the application."""
+    return os.path.join(BASE_DIR, ARTIFACTS_DIR, file_name)
+
+
+def get_settings_path():
+    """Returns a reasonable place to put a settings file on different platforms."""
+    system_name = platform.system()
+    if system_name == 'Linux':
+        return os.path.expanduser(f'~/.{APP_NAME}/settings.json')
+    if system_name == 'Darwin':
+        return os.path.expanduser(f'~/Library/Application Support/{APP_NAME}/settings.json')
+    return os.path.join(os.getenv('LOCALAPPDATA'), APP_NAME, 'preferences.json')
+
+
+def get_app_data_path(file_name):
+    """Returns a path for a file that the app manages itself next to the settings file."""
+    return os.path.join(os.path.dirname(get_settings_path()), file_name)
+
+
+def load_user_info(path=None):
+    """
+    Reads a dict containing the user's info from a settings file (the user's own by default).
+    Initializes an empty dict if a file isn't found.
+    """
+    if not path:
+        path = get_settings_path()
+    if os.path.exists(path):
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    return {s:'' for s in USER_INFO_SETTINGS}
+
+
+def save_user_info(settings):
+    """Saves the specified settings dict to the user's settings file."""
+    pref_path = get_settings_path()
+    pref_dir = os.path.dirname(pref_path)
+    if not os.path.exists(pref_dir):
+        os.makedirs(pref_dir)
+    with open(pref_path, 'w', encoding='utf-8') as f:
+        json.dump(settings, f)
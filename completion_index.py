@@ -0,0 +1,136 @@
+"""
+A prebuilt index for completing the names of buildings as they're typed, without depending on Qt.
+Besides the start of a name, the typed text can be the start of any of its words ("Eugene" finds
+"North Eugene"), an abbreviation ("CI" finds "Chinese Immersion"), or part of a word ("mers" also
+finds it). Case, accents, and extra spaces are ignored.
+
+
+Disclaimer of Warranty
+
+This software is provided "as is," without any warranties of any kind, either express or implied,
+including but not limited to the implied warranties of merchantability, fitness for a particular
+purpose, or non-infringement. The entire risk arising out of the use or performance of the software
+remains with you. In no event shall the software provider be liable for any direct, indirect,
+incidental, special, consequential, or punitive damages whatsoever arising out of or in connection
+with the use or inability to use the software.
+"""
+import heapq
+import re
+import unicodedata
+
+from rlm_document import UPDATED_SCHOOL_NAMES
+
+
+__version__ = "1.0.0"
+__date__ = "Oct '26"
+
+# How a name matched, in the order that the matches are returned.
+NAME_MATCH = 0
+WORD_MATCH = 1
+
+# Text this long or longer is also looked for in the middle of words.
+NGRAM_SIZE = 3
+
+WORD_RE = re.compile(r"[^\W_]+")
+
+
+def normalize(text):
+    """Returns text in lower case without accents or repeated whitespace."""
+    text = unicodedata.normalize('NFKD', text)
+    text = ''.join(c for c in text if not unicodedata.combining(c))
+    return ' '.join(text.lower().split())
+
+
+class CompletionIndex:
+    """
+    The names are interned to ids in alphabetical order. Each node of the trie holds the ids of
+    every name with a key that passes through it, best first, so looking up a prefix only walks
+    one node per character. Keys that start at a later word, abbreviations, and aliases are added
+    to the same trie. Text in the middle of a word is found by intersecting the names that
+    contain each of its n-grams.
+    """
+
+    def __init__(self, names, aliases=None):
+        if aliases is None:
+            aliases = UPDATED_SCHOOL_NAMES
+        self.names = sorted(set(names), key=lambda n: (normalize(n), n))
+        self.keys = [normalize(n) for n in self.names]
+        ids = {name: i for i, name in enumerate(self.names)}
+        self._trie = ({}, [])
+        self._ngrams = {}
+        for i, key in enumerate(self.keys):
+            self._add(key, NAME_MATCH, i)
+            words = [m for m in WORD_RE.finditer(key)]
+            for m in words[1:]:
+                self._add(key[m.start():], WORD_MATCH, i)
+            if len(words) > 1:
+                self._add(''.join(m.group()[0] for m in words), WORD_MATCH, i)
+            for j in range(0, len(key) - NGRAM_SIZE + 1):
+                self._ngrams.setdefault(key[j:j + NGRAM_SIZE], set()).add(i)
+        for alias, name in aliases.items():
+            if name in ids:
+                self._add(normalize(alias), WORD_MATCH, ids[name])
+        self._sort(self._trie)
+
+    def _add(self, key, match, i):
+        node = self._trie
+        for c in key:
+            node = node[0].setdefault(c, ({}, []))
+            node[1].append((match, i))
+
+    def _sort(self, root):
+        # Replace each node's (match, id) pairs with its ids, best first and without duplicates.
+        nodes = [root]
+        while nodes:
+            children, entries = nodes.pop()
+            seen = set()
+            ranked = []
+            for _, i in sorted(entries):
+                if i not in seen:
+                    seen.add(i)
+                    ranked.append(i)
+            entries[:] = ranked
+            nodes.extend(children.values())
+
+    def __len__(self):
+        return len(self.names)
+
+    def matches(self, text, limit=None):
+        """
+        Returns the names that match text: names that start with it, then names with a later word
+        or abbreviation that starts with it (both in alphabetical order), then names that contain
+        it, the earliest occurrence first. At most limit names are returned if it's specified.
+        """
+        query = normalize(text)
+        if not query:
+            return []
+        node = self._trie
+        for c in query:
+            node = node[0].get(c)
+            if node is None:
+                break
+        result = list(node[1]) if node else []
+
+        if len(query) >= NGRAM_SIZE and (limit is None or len(result) < limit):
+            postings = []
+            for j in range(0, len(query) - NGRAM_SIZE + 1):
+                posting = self._ngrams.get(query[j:j + NGRAM_SIZE])
+                if not posting:
+                    postings = None
+                    break
+                postings.append(posting)
+            if postings:
+                postings.sort(key=len)
+                seen = set(result)
+                found = [(self.keys[i].find(query), i)
+                            for i in postings[0].intersection(*postings[1:]) if i not in seen]
+                found = [f for f in found if f[0] >= 0]
+                if limit is None:
+                    found.sort()
+                else:
+                    found = heapq.nsmallest(limit - len(result), found)
+                result += [i for _, i in found]
+
+        if limit is not None:
+            result = result[:limit]
+        return [self.names[i] for i in result]
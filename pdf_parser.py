@@ -1,5 +1,6 @@
 """
-Parses 'official' driving distances between 4j school buildings from a PDF.
+Parses 'official' driving distances between 4j school buildings from a PDF, and the geometry of the
+fields in the mileage forms.
 
 
 Disclaimer of Warranty
@@ -11,10 +12,14 @@ remains with you. In no event shall the software provider be liable for any dire
 incidental, special, consequential, or punitive damages whatsoever arising out of or in connection
 with the use or inability to use the software.
 """
-import fitz
+import hashlib
+import json
+import os
+import re
+from array import array
 
 
-__version__ = "1.0.0"
+__version__ = "1.1.0"
 __date__ = "Nov '24"
 
 
@@ -25,6 +30,8 @@ def _parse_float(value):
         return 0
 
 def parse_distance_table(path):
+    # PyMuPDF is only imported when a PDF actually has to be read, see load_distance_table().
+    import fitz
     pdf = fitz.open(path)
     page = pdf.load_page(0)
     table = page.find_tables().tables[0].extract()
@@ -43,3 +50,193 @@ def parse_distance_table(path):
     data[schools[-1]] = {}
     pdf.close()
     return data
+
+
+class DistanceIndex:
+    """
+    A compact, read-only view of the dict returned by parse_distance_table(). Building names are
+    interned to integer ids and the distances are stored in a dense symmetric matrix so a lookup
+    is a single dict hit per name regardless of the direction of travel. The mapping methods are
+    forwarded to the original dict so it can still be used wherever a dict of names is expected.
+    """
+
+    def __init__(self, data):
+        self.data = data
+        self.ids = {name: i for i, name in enumerate(data)}
+        # Destinations that never appear as an origin get the next ids, in the order they're seen.
+        for dests in data.values():
+            for name in dests:
+                self.ids.setdefault(name, len(self.ids))
+        self.names = list(self.ids)
+        self.size = len(self.names)
+        # Zero doubles as 'unknown' because that's what the parser stores for empty cells.
+        self.matrix = array('d', bytes(8 * self.size * self.size))
+        for origin, dests in data.items():
+            i = self.ids[origin]
+            for dest, value in dests.items():
+                j = self.ids[dest]
+                self.matrix[i * self.size + j] = value
+                self.matrix[j * self.size + i] = value
+
+    def find(self, origin, dest):
+        """Returns the distance between two buildings (in either order) or None if unknown."""
+        i = self.ids.get(origin, None)
+        j = self.ids.get(dest, None)
+        if i is None or j is None:
+            return None
+        return self.matrix[i * self.size + j] or None
+
+    def keys(self):
+        """Returns the names of the buildings in the same order as the original table."""
+        return self.data.keys()
+
+    def get(self, key, default=None):
+        """Forwards to the original dict."""
+        return self.data.get(key, default)
+
+    def __getitem__(self, key):
+        return self.data[key]
+
+    def __contains__(self, key):
+        return key in self.data
+
+    def __iter__(self):
+        return iter(self.data)
+
+    def __len__(self):
+        return len(self.data)
+
+
+def _hash_file(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(65536), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _load_cached(key, cache_path, parse):
+    """
+    Returns a previous result from cache_path if it has the same key, otherwise calls parse() and
+    saves its result with the key.
+    """
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+        if cache.get('key') == key:
+            return cache['data']
+    except (OSError, ValueError, KeyError, AttributeError):
+        pass
+
+    data = parse()
+    try:
+        cache_dir = os.path.dirname(cache_path)
+        if cache_dir and not os.path.exists(cache_dir):
+            os.makedirs(cache_dir)
+        # Write to a temporary file first so a partially written cache is never read.
+        tmp_path = f"{cache_path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'key': key, 'data': data}, f)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+    return data
+
+
+def load_distance_table(path, cache_path=None):
+    """
+    Returns the same dict as parse_distance_table() but reuses a previous result from cache_path
+    when it was produced by this parser version from a PDF with the same contents. Finding the
+    table in the PDF is slow so it's only done when the PDF (or the parser) changes.
+    """
+    if not cache_path:
+        return parse_distance_table(path)
+    key = f"{__version__}:{_hash_file(path)}"
+    return _load_cached(key, cache_path, lambda: parse_distance_table(path))
+
+
+# The names of the fields in the forms' rows, in the same order as widget_data.FIELD_NAME_FMTS.
+ROW_FIELD_RE = re.compile(r"txtP\d+(Date|FromLoc|ToLoc|Purpose|AmtParking|Miles)\.(\d+)$")
+ROW_FIELD_COLS = {"Date": 0, "FromLoc": 1, "ToLoc": 2, "Purpose": 3, "AmtParking": 4, "Miles": 5}
+CHECK_BOX_RE = re.compile(r"Check Box(\d+)$")
+CHECK_BOX_COL = 6
+
+
+def _parse_form_page(page, first_check_box):
+    """
+    Returns a dict with the page's 'fields' above the rows, its 'total_fields' (both lists of
+    [name, rect]), and 'row_rects', a flat list with the rect of each of each row's fields.
+    """
+    import fitz
+    fields = []
+    total_fields = []
+    rows = {}
+    for widget in page.widgets():
+        if widget.field_type not in (fitz.PDF_WIDGET_TYPE_TEXT, fitz.PDF_WIDGET_TYPE_CHECKBOX):
+            continue
+        name = widget.field_name
+        rect = [widget.rect.x0, widget.rect.y0, widget.rect.x1, widget.rect.y1]
+        match = ROW_FIELD_RE.match(name)
+        if match:
+            rows.setdefault(int(match.group(2)), {})[ROW_FIELD_COLS[match.group(1)]] = rect
+            continue
+        match = CHECK_BOX_RE.match(name)
+        if match:
+            rows.setdefault(int(match.group(1)) - first_check_box, {})[CHECK_BOX_COL] = rect
+            continue
+        if 'Tot' in name:
+            total_fields.append([name, rect])
+        else:
+            fields.append([name, rect])
+
+    row_rects = []
+    for row in range(0, len(rows)):
+        cols = rows.get(row, {})
+        if len(cols) != CHECK_BOX_COL + 1:
+            raise ValueError(f"Row {row} of page {page.number + 1} is missing fields.")
+        for col in range(0, CHECK_BOX_COL + 1):
+            row_rects += cols[col]
+    if not row_rects:
+        raise ValueError(f"Page {page.number + 1} doesn't have any fields.")
+    return {'fields': fields, 'total_fields': total_fields, 'row_rects': row_rects}
+
+
+def parse_form_widgets(form_path, additional_form_path=None):
+    """
+    Returns a list with the geometry of the fields on each page (see _parse_form_page()) of the
+    form and the additional form. Raises ValueError if the fields aren't all there, for instance
+    because the PDF has been flattened.
+    """
+    import fitz
+    pages = []
+    first_check_box = 1
+    for path in (form_path, additional_form_path):
+        if not path:
+            continue
+        pdf = fitz.open(path)
+        try:
+            page = _parse_form_page(pdf.load_page(0), first_check_box)
+        finally:
+            pdf.close()
+        first_check_box += len(page['row_rects']) // (4 * (CHECK_BOX_COL + 1))
+        pages.append(page)
+    return pages
+
+
+def load_form_widgets(form_path, additional_form_path=None, cache_path=None):
+    """
+    Returns the same list as parse_form_widgets(), or None if the forms don't have fields, reusing
+    a previous result from cache_path when it came from PDFs with the same contents.
+    """
+    def parse():
+        try:
+            return parse_form_widgets(form_path, additional_form_path)
+        except ValueError:
+            return None
+
+    if not cache_path:
+        return parse()
+    key = f"{__version__}:{_hash_file(form_path)}"
+    if additional_form_path:
+        key += f":{_hash_file(additional_form_path)}"
+    return _load_cached(key, cache_path, parse)
@@ -3,7 +3,9 @@ Fills text field values into the 4j 'Mileage Reimbursement Request' form.
 
 The official PDF is very brittle and its checkboxes don't always render correctly in different
 applications or on older macOS machines. To ensure compatibility, the original form's field_names
-and widget geometries were extracted and this module now uses them to draw the forms.
+and widget geometries were extracted and this module now uses them to draw the forms. If a new
+version of the form still has its fields, use_form_widgets() reads their geometry from the PDF
+instead (see pdf_parser.parse_form_widgets()).
 
 
 Disclaimer of Warranty
@@ -15,19 +17,25 @@ remains with you. In no event shall the software provider be liable for any dire
 incidental, special, consequential, or punitive damages whatsoever arising out of or in connection
 with the use or inability to use the software.
 """
+import math
+from array import array
 from datetime import datetime
+from functools import lru_cache
 
-import fitz
-from widget_data import FIELD_NAME_FMTS, PAGE_1_WIDGETS, PAGE_2_WIDGETS
+from pdf_parser import load_form_widgets
+from widget_data import (FIELD_NAME_FMTS, PAGE_1_FIELDS, PAGE_1_ROW_RECTS, PAGE_1_TOTAL_FIELDS,
+                            PAGE_2_FIELDS, PAGE_2_ROW_RECTS, PAGE_2_TOTAL_FIELDS,
+                            ROW_FIELD_COUNT, compare_form_widgets, get_row_count, get_row_rect)
 
 
-__version__ = "1.2.0"
-__date__ = "Feb '25"
+__version__ = "1.4.0"
+__date__ = "Oct '26"
 
 
 NUM_ROWS_PAGE_1 = 22
 NUM_ROWS_PAGE_2 = 34
-MAX_ROWS = NUM_ROWS_PAGE_1 + NUM_ROWS_PAGE_2
+# Longer tables are continued on additional copies of the forms.
+ROWS_PER_FORM_SET = NUM_ROWS_PAGE_1 + NUM_ROWS_PAGE_2
 
 PARKING_COL_INDEX = 4
 MILES_COL_INDEX = 5
@@ -35,6 +43,7 @@ ROUND_TRIP_COL_INDEX = 6
 
 DEFAULT_FONT_SIZE = 9.5
 FONT_SIZE_DECREMENT = 0.5
+FONT_NAME = "helv" # The default for insert_textbox()
 
 
 USER_INFO = [("Name", "txtEmpName"),
@@ -42,36 +51,189 @@ USER_INFO = [("Name", "txtEmpName"),
     ("Building/Department", "txtSchool"),
     ("Account Number", "txtInDistAcct")]
 
+# The grand total of a table that needs more than one set of forms is drawn on the first page of
+# the last set, in line with its "Total (Both Pages)" and left of that label (which is about this
+# wide), see _draw_grand_total().
+GRAND_TOTAL_FIELD = "txtP1&2TotParking"
+GRAND_TOTAL_LABEL_WIDTH = 105
+GRAND_TOTAL_KEY = "GRAND_TOTAL"
+
+# The forms' own geometry is only used if it has all of these fields on each page, otherwise the
+# PDFs would be missing the user's info or the totals. See use_form_widgets().
+REQUIRED_FIELDS = ([field_name for _, field_name in USER_INFO] +
+                        [field_name for field_name, _ in PAGE_1_TOTAL_FIELDS],
+                    [field_name for field_name, _ in PAGE_2_TOTAL_FIELDS])
+
 INPUT_STR_FORMAT = "%m/%d/%Y" # Equivalent to QDate's toString("MM/dd/yyyy")
 OUTPUT_STR_FORMAT = "%m/%d/%y"
 
+# Cleaned copies of the blank forms, see _get_template().
+_templates = {}
+
+# The (fields, row_rects, total_fields) of each page of a set of forms. The geometry from
+# widget_data is used unless use_form_widgets() found the fields in the forms themselves.
+DEFAULT_FORM_PAGES = ((PAGE_1_FIELDS, PAGE_1_ROW_RECTS, PAGE_1_TOTAL_FIELDS),
+                        (PAGE_2_FIELDS, PAGE_2_ROW_RECTS, PAGE_2_TOTAL_FIELDS))
+_form_pages = {}
+
+# The widths of the font's first 256 characters plus its line height and descender (all at a
+# font size of 1), see _get_font_metrics().
+_font_metrics = None
+
+
+class FillCancelled(Exception):
+    """Raised by fill_form() when its progress callback asks it to stop."""
+
+
+def _get_font_metrics():
+    global _font_metrics
+    if _font_metrics is None:
+        import fitz
+        # Use the same values that insert_textbox() will find in the output document.
+        pdf = fitz.open()
+        page = pdf.new_page()
+        xref = page.insert_font(fontname=FONT_NAME)
+        widths = [w for _, w in pdf.get_char_widths(xref, 256)]
+        font = fitz.Font(FONT_NAME)
+        pdf.close()
+        line_height = font.ascender - font.descender
+        if line_height <= 1:
+            line_height = 1.2
+        _font_metrics = (widths, line_height, font.descender)
+    return _font_metrics
+
+
+def _count_lines(value, max_width, widths):
+    """
+    Returns the number of lines that insert_textbox() breaks value into, using the same word
+    wrapping. The widths are for a font size of 1 so max_width must be scaled to match.
+    """
+    def pixlen(x):
+        return sum(widths[ord(c)] for c in x)
+
+    space_len = widths[32]
+    text = ""
+    lines = value.splitlines()
+    for i, line in enumerate(lines):
+        lbuff = ""
+        rest = max_width
+        for word in line.split(" "):
+            word_len = pixlen(word)
+            if rest >= word_len:
+                lbuff += word + " "
+                rest -= word_len + space_len
+                continue
+            if lbuff:
+                text += lbuff.rstrip() + "\n"
+            lbuff = ""
+            rest = max_width
+            if word_len <= max_width:
+                lbuff = word + " "
+                rest = max_width - word_len - space_len
+                continue
+            # A word that is longer than a line is split between characters.
+            for c in word:
+                if pixlen(lbuff) <= max_width - widths[ord(c)]:
+                    lbuff += c
+                else:
+                    text += lbuff + "\n"
+                    lbuff = c
+            lbuff += " "
+            rest = max_width - pixlen(lbuff)
+        if lbuff:
+            text += lbuff.rstrip()
+        if i < len(lines) - 1:
+            text += "\n"
+    if text.endswith("\n"):
+        text = text[:-1]
+    return text.count("\n") + 1
+
+
+def _steps_to(font_size):
+    """Returns the number of FONT_SIZE_DECREMENTs from DEFAULT_FONT_SIZE down to font_size."""
+    return max(0, math.ceil((DEFAULT_FONT_SIZE - font_size) / FONT_SIZE_DECREMENT - 1e-9))
+
+
+@lru_cache(maxsize=4096)
+def _fit_font_size(value, width, height):
+    """
+    Returns (font_size, skipped) where font_size is the first size, starting at DEFAULT_FONT_SIZE
+    and decreasing by FONT_SIZE_DECREMENT, at which insert_textbox() can fit value into a box of
+    the specified width and height. skipped is the number of larger sizes that don't fit.
+    """
+    import fitz
+    widths, line_height, descender = _get_font_metrics()
+    # Simple fonts replace the characters that they don't have.
+    value = ''.join(c if ord(c) < 256 else '?' for c in value)
+    limit = height + fitz.EPSILON
+
+    def fits(font_size):
+        lines = _count_lines(value, width / font_size, widths)
+        return font_size * (line_height * lines - descender) <= limit
+
+    if '\n' in value:
+        skipped = 0
+        while not fits(DEFAULT_FONT_SIZE - skipped * FONT_SIZE_DECREMENT):
+            skipped += 1
+        return (DEFAULT_FONT_SIZE - skipped * FONT_SIZE_DECREMENT, skipped)
+
+    # On one line the text is (line_height - descender) * font_size tall and its length is also
+    # proportional to font_size, so the largest size that fits follows directly from the box.
+    # Trailing spaces aren't drawn, the same as when insert_textbox() lays out a line.
+    text_len = sum(widths[ord(c)] for c in value.rstrip())
+    font_size = limit / (line_height - descender)
+    if text_len > 0:
+        font_size = min(font_size, width / text_len)
+    skipped = _steps_to(font_size)
+    # Wrapping onto more lines can only help at sizes that leave room for a second line.
+    for i in range(_steps_to(limit / (2 * line_height - descender)), skipped):
+        if fits(DEFAULT_FONT_SIZE - i * FONT_SIZE_DECREMENT):
+            return (DEFAULT_FONT_SIZE - i * FONT_SIZE_DECREMENT, i)
+    return (DEFAULT_FONT_SIZE - skipped * FONT_SIZE_DECREMENT, skipped)
 
-def _insert_text(page, widget_rect, value, alignment):
-    """The bounding boxes of the widgets in the original PDF are not uniform."""
-    font_size = DEFAULT_FONT_SIZE
-    finished = False
-    while not finished:
-        unused_space = page.insert_textbox(widget_rect, value, fontsize=font_size, align=alignment)
-        if unused_space < 0:
-            font_size -= FONT_SIZE_DECREMENT
-        else:
-            finished = True
 
-
-def _update_widget(page, field_name, widget_rect, value):
+def _insert_text(page, widget_rect, value, alignment):
+    """
+    The bounding boxes of the widgets in the original PDF are not uniform so the text is drawn
+    using the largest font size that fits. Returns the number of layout passes that were saved by
+    computing the size instead of trying each size in turn.
+    """
+    x0, y0, x1, y1 = widget_rect
+    font_size, saved = _fit_font_size(value, x1 - x0, y1 - y0)
+    while page.insert_textbox(widget_rect, value, fontsize=font_size, align=alignment) < 0:
+        # Rounding could make the computed size a hair too large.
+        font_size -= FONT_SIZE_DECREMENT
+        saved -= 1
+    return saved
+
+
+def _get_field_kind(field_name):
+    """Returns how a field's value is formatted: 'Parking', 'Miles', 'Date', 'Check', or None."""
+    for kind in ('Parking', 'Miles', 'Date', 'Check'):
+        if kind in field_name:
+            return kind
+    return None
+
+
+# The kinds of the fields in each row, in the order of FIELD_NAME_FMTS.
+ROW_FIELD_KINDS = [_get_field_kind(fmt) for fmt in FIELD_NAME_FMTS]
+
+
+def _update_widget(page, kind, widget_rect, value, stats):
+    import fitz
     alignment = fitz.TEXT_ALIGN_CENTER
     try:
-        if 'Parking' in field_name:
+        if kind == 'Parking':
             # Don't clutter the parking col with zeroes.
             if value:
                 value = f"{value:0.2f}"
             else:
                 value = ''
-        elif 'Miles' in field_name:
+        elif kind == 'Miles':
             value = f"{value:0.1f}"
-        elif 'Date' in field_name:
+        elif kind == 'Date':
             value = datetime.strptime(value, INPUT_STR_FORMAT).strftime(OUTPUT_STR_FORMAT)
-        elif 'Check' in field_name:
+        elif kind == 'Check':
             if value == '1':
                 value = 'X'
             else:
@@ -86,7 +248,8 @@ def _update_widget(page, field_name, widget_rect, value):
     # Redraw the widget's outline (since we removed all of the actual widgets).
     page.draw_rect(widget_rect, color=(0, 0, 0), fill=(1, 1, 1), overlay=True)
     if value:
-        _insert_text(page, widget_rect, value, alignment)
+        stats['layout_passes'] += 1
+        stats['layout_passes_saved'] += _insert_text(page, widget_rect, value, alignment)
 
 
 def _parse_float(value):
@@ -96,100 +259,209 @@ def _parse_float(value):
         return 0
 
 
-def _write_pdf(form_path, additional_form_path, save_path, form_data):
-    pdf = fitz.open(form_path)
-    page = pdf.load_page(0)
-    page.clean_contents()
-    for key, widget_rect in PAGE_1_WIDGETS.items():
-        form_value = form_data.get(key, '')
-        _update_widget(page, key, widget_rect, form_value)
-
-    if additional_form_path:
-        add_pdf = fitz.open(additional_form_path)
-        pdf.insert_pdf(add_pdf)
-        add_pdf.close()
-        page = pdf.load_page(1)
-        page.clean_contents()
-        for key, widget_rect in PAGE_2_WIDGETS.items():
-            form_value = form_data.get(key, '')
-            _update_widget(page, key, widget_rect, form_value)
-
-    pdf.save(save_path)
-    pdf.close()
-
-
-def fill_form(form_path, additional_form_path, save_path, data):
-    """Compute totals while creating a dict for looking up values using the PDF's field_names"""
-    user_info = data['USER_INFO']
-    table = data['TABLE']
-
-    page_parking_totals = [0]
-    page_miles_totals = [0]
-
+def _get_template(form_path, additional_form_path):
+    """
+    Returns the bytes of a blank form (with the additional page appended if additional_form_path
+    is specified) whose pages have already been cleaned. The forms are only read from the disk and
+    prepared the first time they're needed.
+    """
+    key = (form_path, additional_form_path)
+    template = _templates.get(key, None)
+    if template is None:
+        # PyMuPDF is only imported once a PDF is needed so starting the GUI doesn't pay for it.
+        import fitz
+        pdf = fitz.open(form_path)
+        pdf.load_page(0).clean_contents()
+        if additional_form_path:
+            add_pdf = fitz.open(additional_form_path)
+            pdf.insert_pdf(add_pdf)
+            add_pdf.close()
+            pdf.load_page(1).clean_contents()
+        template = pdf.tobytes()
+        pdf.close()
+        _templates[key] = template
+    return template
+
+
+def use_form_widgets(form_path, additional_form_path, cache_path=None):
+    """
+    Draws the forms using the geometry of the fields in the PDFs themselves (for instance, after the
+    district issues a new version) instead of the geometry in widget_data. Returns a list of the
+    differences from widget_data, or None if the PDFs don't have their fields (the bundled forms
+    have been flattened) in which case widget_data is still used. widget_data is also still used
+    if a page is missing any of its REQUIRED_FIELDS, and the last difference says so.
+    """
+    pages = load_form_widgets(form_path, additional_form_path, cache_path)
+    if pages is None:
+        return None
+    differences = compare_form_widgets(pages)
+    key = (form_path, additional_form_path)
+    expected_pages = 2 if additional_form_path else 1
+    missing = len(pages) != expected_pages or any(
+        not set(required).issubset(name for name, _ in page['fields'] + page['total_fields'])
+        for page, required in zip(pages, REQUIRED_FIELDS))
+    if missing:
+        _form_pages.pop(key, None)
+        differences.append("The forms are missing fields for the user info or the totals so " +
+                            "the fields that this version was made for are used instead.")
+    else:
+        _form_pages[key] = tuple(
+            (p['fields'], array('d', p['row_rects']), p['total_fields']) for p in pages)
+    return differences
+
+
+def preload_templates(form_path, additional_form_path):
+    """Prepares the templates ahead of time so the first fill_form() call doesn't pay for it."""
+    _get_template(form_path, None)
+    _get_template(form_path, additional_form_path)
+
+
+def _update_named_widgets(page, fields, form_values, stats):
+    for field_name, widget_rect in fields:
+        form_value = form_values.get(field_name, '')
+        _update_widget(page, _get_field_kind(field_name), widget_rect, form_value, stats)
+
+
+def _update_page(page, page_fields, row_rects, total_fields, form_values, rows, stats,
+                    row_drawn=None):
+    """
+    Draws the fields from top to bottom. Rows without any data are left blank. row_drawn() is
+    called after each row if it's specified.
+    """
+    _update_named_widgets(page, page_fields, form_values, stats)
+    empty_row = [''] * ROW_FIELD_COUNT
+    for row in range(0, get_row_count(row_rects)):
+        row_values = rows[row] if row < len(rows) else empty_row
+        for col in range(0, ROW_FIELD_COUNT):
+            _update_widget(page, ROW_FIELD_KINDS[col], get_row_rect(row_rects, row, col),
+                            row_values[col], stats)
+        if row_drawn:
+            row_drawn()
+    _update_named_widgets(page, total_fields, form_values, stats)
+
+
+def _draw_grand_total(page, row_rects, total_fields, text, stats):
+    """Draws text to the left of the page's "Total (Both Pages)" label, if the page has one."""
+    import fitz
+    found = dict(total_fields).get(GRAND_TOTAL_FIELD)
+    if found is None or not get_row_count(row_rects):
+        return
+    x0 = get_row_rect(row_rects, 0, 0)[0]
+    rect = (x0, found[1], found[0] - GRAND_TOTAL_LABEL_WIDTH, found[3])
+    stats['layout_passes'] += 1
+    # Add a leading space because TEXT_ALIGN_LEFT is very aggressive.
+    stats['layout_passes_saved'] += _insert_text(page, rect, f" {text}", fitz.TEXT_ALIGN_LEFT)
+
+
+def _progress_steps(progress, total):
+    """
+    Calls progress(0, total) and returns a function to call after each step, or None if progress
+    isn't specified. Either raises FillCancelled if progress returns False.
+    """
+    if not progress:
+        return None
+    if progress(0, total) is False:
+        raise FillCancelled()
+    done = 0
+
+    def step():
+        nonlocal done
+        done += 1
+        if progress(done, total) is False:
+            raise FillCancelled()
+    return step
+
+
+def _write_pdf(form_path, additional_form_path, save_path, form_pages, form_sets, progress=None):
+    """
+    Draws each (form_values, page_rows) in form_sets on its own copy of the form (with the
+    additional page if page_rows has rows for it). Returns a dict with the number of text layout
+    passes used and saved while drawing. See fill_form() for progress.
+    """
+    import fitz
+    stats = {'layout_passes': 0, 'layout_passes_saved': 0}
+
+    # Each row that's drawn is a step, and so is saving.
+    total = 1 + sum(get_row_count(form_pages[i][1])
+                        for _, page_rows in form_sets for i in range(0, len(page_rows)))
+    row_drawn = _progress_steps(progress, total)
+
+    pdf = None
+    try:
+        for form_values, page_rows in form_sets:
+            has_page_2 = len(page_rows) > 1
+            template = _get_template(form_path, additional_form_path if has_page_2 else None)
+            if pdf is None:
+                pdf = fitz.open(stream=template, filetype='pdf')
+                first_page = 0
+            else:
+                first_page = pdf.page_count
+                form_pdf = fitz.open(stream=template, filetype='pdf')
+                pdf.insert_pdf(form_pdf)
+                form_pdf.close()
+
+            for i, rows in enumerate(page_rows):
+                fields, row_rects, total_fields = form_pages[i]
+                page = pdf.load_page(first_page + i)
+                _update_page(page, fields, row_rects, total_fields, form_values, rows, stats,
+                                row_drawn)
+                if i == 0 and GRAND_TOTAL_KEY in form_values:
+                    _draw_grand_total(page, row_rects, total_fields, form_values[GRAND_TOTAL_KEY],
+                                        stats)
+
+        pdf.save(save_path)
+    finally:
+        if pdf is not None:
+            pdf.close()
+    if progress:
+        progress(total, total)
+    return stats
+
+
+def _get_form_values(user_info, table, page_lens):
+    """
+    Returns (values, page_rows, parking_total, miles_total) for one set of forms. values is a dict
+    for looking up the named fields (user info and totals) using the PDF's field_names. page_rows
+    holds the values of each page's rows, in the order of FIELD_NAME_FMTS. The table can't have
+    more rows than the pages (whose lengths are page_lens) have.
+    """
     values = {}
 
     for setting, field_name in USER_INFO:
         values[field_name] = user_info[setting]
 
-    page_len = len(table) if len(table) < NUM_ROWS_PAGE_1 else NUM_ROWS_PAGE_1
+    page_rows = []
+    page_parking_totals = []
+    page_miles_totals = []
+    data_has_rt_checkbox = len(table[0]) > ROUND_TRIP_COL_INDEX
     table_row = 0
-    row = 0
-    data_has_rt_checkbox = len(table[table_row]) > ROUND_TRIP_COL_INDEX
-    while table_row < page_len:
-        for j in range(0, PARKING_COL_INDEX):
-            field_name = FIELD_NAME_FMTS[j].format(1, row)
-            values[field_name] = table[table_row][j]
-
-        round_trip = False
-        if data_has_rt_checkbox:
-            field_name = FIELD_NAME_FMTS[ROUND_TRIP_COL_INDEX].format(table_row + 1)
-            values[field_name] = table[table_row][ROUND_TRIP_COL_INDEX]
-            round_trip = values[field_name] != '0'
-
-        field_name = FIELD_NAME_FMTS[PARKING_COL_INDEX].format(1, row)
-        value = _parse_float(table[table_row][PARKING_COL_INDEX])
-        values[field_name] = value
-        page_parking_totals[0] += value
-
-        field_name = FIELD_NAME_FMTS[MILES_COL_INDEX].format(1, row)
-        value = _parse_float(table[table_row][MILES_COL_INDEX])
-        values[field_name] = value
-        page_miles_totals[0] += value
-        if round_trip:
-            page_miles_totals[0] += value
-
-        row += 1
-        table_row += 1
-
-    if len(table) > NUM_ROWS_PAGE_1:
-        page_parking_totals.append(0)
-        page_miles_totals.append(0)
-        row = 0
-        while table_row < len(table):
-            for j in range(0, PARKING_COL_INDEX):
-                field_name = FIELD_NAME_FMTS[j].format(2, row)
-                values[field_name] = table[table_row][j]
-
-            round_trip = False
+    for page_len in page_lens:
+        if table_row >= len(table):
+            break
+        rows = []
+        parking_total = 0
+        miles_total = 0
+        for trip in table[table_row:table_row + page_len]:
+            row_values = trip[0:PARKING_COL_INDEX]
+
+            parking = _parse_float(trip[PARKING_COL_INDEX])
+            parking_total += parking
+
+            miles = _parse_float(trip[MILES_COL_INDEX])
+            miles_total += miles
+
+            round_trip = ''
             if data_has_rt_checkbox:
-                field_name = FIELD_NAME_FMTS[ROUND_TRIP_COL_INDEX].format(table_row + 1)
-                values[field_name] = table[table_row][ROUND_TRIP_COL_INDEX]
-                round_trip = values[field_name] != '0'
-
-            field_name = FIELD_NAME_FMTS[PARKING_COL_INDEX].format(2, row)
-            value = _parse_float(table[table_row][PARKING_COL_INDEX])
-            values[field_name] = value
-            page_parking_totals[1] += value
+                round_trip = trip[ROUND_TRIP_COL_INDEX]
+                if round_trip != '0':
+                    miles_total += miles
 
-            field_name = FIELD_NAME_FMTS[MILES_COL_INDEX].format(2, row)
-            value = _parse_float(table[table_row][MILES_COL_INDEX])
-            values[field_name] = value
-            page_miles_totals[1] += value
-            if round_trip:
-                page_miles_totals[1] += value
-
-            row += 1
-            table_row += 1
+            row_values += [parking, miles, round_trip]
+            rows.append(row_values)
+        table_row += len(rows)
+        page_rows.append(rows)
+        page_parking_totals.append(parking_total)
+        page_miles_totals.append(miles_total)
 
     for i in range(0, len(page_parking_totals)):
         values[f"txtP{i+1}TotParking"] = page_parking_totals[i]
@@ -198,7 +470,50 @@ def fill_form(form_path, additional_form_path, save_path, data):
     values["txtP1&2TotParking"] = sum(page_parking_totals)
     values["txtP1&P2TotMiles"] = sum(page_miles_totals)
 
-    if len(table) > NUM_ROWS_PAGE_1:
-        _write_pdf(form_path, additional_form_path, save_path, values)
-    else:
-        _write_pdf(form_path, None, save_path, values)
+    return (values, page_rows, values["txtP1&2TotParking"], values["txtP1&P2TotMiles"])
+
+
+def format_grand_total(form_sets, parking_total, miles_total):
+    """Returns the text for the grand totals of a table that needs form_sets sets of forms."""
+    return (f"Grand Total ({form_sets} sets of forms): parking {parking_total:0.2f}, " +
+                f"miles {miles_total:0.1f}")
+
+
+def fill_form(form_path, additional_form_path, save_path, data, progress=None):
+    """
+    Compute totals while creating a dict for looking up values using the PDF's field_names. Tables
+    with more rows than a set of forms has (ROWS_PER_FORM_SET for the bundled forms) are continued
+    on as many sets of forms as necessary, each with its own totals, and the grand totals of every
+    set are drawn on the last one. Returns a dict of statistics about drawing the form (see
+    _write_pdf()) along with the number of form sets and the grand totals.
+
+    If progress is specified it's called with (steps_done, total_steps) as the rows are drawn and
+    after the PDF is saved. If it returns False, FillCancelled is raised and nothing is saved.
+    """
+    user_info = data['USER_INFO']
+    table = data['TABLE']
+
+    form_pages = _form_pages.get((form_path, additional_form_path), DEFAULT_FORM_PAGES)
+    page_lens = [get_row_count(row_rects) for _, row_rects, _ in form_pages]
+    if not additional_form_path:
+        page_lens = page_lens[0:1]
+    rows_per_set = sum(page_lens)
+
+    form_sets = []
+    parking_total = 0
+    miles_total = 0
+    for start in range(0, len(table), rows_per_set):
+        rows = table[start:start + rows_per_set]
+        values, page_rows, parking, miles = _get_form_values(user_info, rows, page_lens)
+        form_sets.append((values, page_rows))
+        parking_total += parking
+        miles_total += miles
+    if len(form_sets) > 1:
+        form_sets[-1][0][GRAND_TOTAL_KEY] = format_grand_total(len(form_sets), parking_total,
+                                                                miles_total)
+
+    stats = _write_pdf(form_path, additional_form_path, save_path, form_pages, form_sets, progress)
+    stats['form_sets'] = len(form_sets)
+    stats['parking_total'] = parking_total
+    stats['miles_total'] = miles_total
+    return stats
@@ -0,0 +1,149 @@
+"""
+An opt-in profiling mode for tracking down reports like "Create PDF is slow" or "typing lags".
+Start the app with --profile (or set SMILES_PROFILE=1) and the slow entry points are wrapped in
+cProfile. When the app exits, a .pstats file for each profile and a readable summary of the top
+functions are written next to the settings file:
+
+    $ python3 smiles.py --profile
+    $ python3 -m pstats ~/.Smiles/profile-20261018-101500-main.pstats
+
+Nothing is wrapped unless profiling was asked for, so it costs nothing otherwise.
+
+
+Disclaimer of Warranty
+
+This software is provided "as is," without any warranties of any kind, either express or implied,
+including but not limited to the implied warranties of merchantability, fitness for a particular
+purpose, or non-infringement. The entire risk arising out of the use or performance of the software
+remains with you. In no event shall the software provider be liable for any direct, indirect,
+incidental, special, consequential, or punitive damages whatsoever arising out of or in connection
+with the use or inability to use the software.
+"""
+import sys
+import os
+import io
+import time
+import atexit
+import functools
+import threading
+
+import app_data
+
+
+__version__ = "1.0.0"
+__date__ = "Oct '26"
+
+PROFILE_FLAG = "--profile"
+PROFILE_ENV = "SMILES_PROFILE"
+TOP_COUNT = 30
+
+# The profiles and timings of the wrapped functions, by qualified name.
+_profiles = {}
+_timings = {}
+_running = set()
+_lock = threading.Lock()
+_local = threading.local()
+
+
+def is_requested(argv):
+    """Returns True if profiling was asked for on the command line or in the environment."""
+    return PROFILE_FLAG in argv or os.environ.get(PROFILE_ENV, '0') not in ('', '0')
+
+
+def _wrap(func):
+    import cProfile
+
+    name = func.__qualname__
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        # A profile only runs in the thread that enabled it and can't be nested, so calls made
+        # while another profile is running in this thread show up in that profile instead.
+        profile = None
+        if not getattr(_local, 'profiling', False):
+            with _lock:
+                if name not in _running:
+                    _running.add(name)
+                    profile = _profiles.setdefault(name, cProfile.Profile())
+        start = time.perf_counter()
+        try:
+            if profile:
+                _local.profiling = True
+                profile.enable()
+            return func(*args, **kwargs)
+        finally:
+            if profile:
+                profile.disable()
+                _local.profiling = False
+                with _lock:
+                    _running.discard(name)
+            seconds = time.perf_counter() - start
+            with _lock:
+                calls, total, longest = _timings.get(name, (0, 0.0, 0.0))
+                _timings[name] = (calls + 1, total + seconds, max(longest, seconds))
+
+    return wrapper
+
+
+def install(argv, targets):
+    """
+    Replaces each (owner, attribute name) function in targets with a profiled version if
+    profiling was requested and removes the flag from argv. An owner can be a module or a class,
+    and a function that's in more than one place is wrapped once. Returns True if it did.
+    """
+    if not is_requested(argv):
+        return False
+    while PROFILE_FLAG in argv:
+        argv.remove(PROFILE_FLAG)
+
+    wrappers = {}
+    for owner, attr in targets:
+        func = getattr(owner, attr)
+        if func not in wrappers:
+            wrappers[func] = _wrap(func)
+        setattr(owner, attr, wrappers[func])
+    atexit.register(write_reports)
+    return True
+
+
+def write_reports(out_dir=None, top_count=TOP_COUNT):
+    """
+    Writes a .pstats file for each profile and a summary of all of them to out_dir (next to the
+    settings file by default). Returns the path of the summary, or None if nothing was profiled.
+    """
+    import pstats
+
+    with _lock:
+        profiles = dict(_profiles)
+        timings = dict(_timings)
+    if not timings:
+        return None
+    if not out_dir:
+        out_dir = os.path.dirname(app_data.get_settings_path())
+    os.makedirs(out_dir, exist_ok=True)
+    prefix = os.path.join(out_dir, time.strftime("profile-%Y%m%d-%H%M%S"))
+
+    summary = io.StringIO()
+    summary.write(f"{app_data.APP_NAME} profile, {time.strftime('%Y-%m-%d %H:%M:%S')}, " +
+                    f"Python {sys.version.split()[0]}\n\n")
+    summary.write(f"{'Function':<32}{'Calls':>8}{'Total (s)':>12}{'Mean (ms)':>12}" +
+                    f"{'Max (ms)':>12}\n")
+    for name, (calls, total, longest) in sorted(timings.items(), key=lambda t: -t[1][1]):
+        summary.write(f"{name:<32}{calls:>8}{total:>12.3f}{total / calls * 1000:>12.1f}" +
+                        f"{longest * 1000:>12.1f}\n")
+
+    for name, profile in profiles.items():
+        try:
+            stats = pstats.Stats(profile, stream=summary)
+        except TypeError:
+            # The profile never collected anything.
+            continue
+        stats_path = f"{prefix}-{name}.pstats"
+        stats.dump_stats(stats_path)
+        summary.write(f"\n\n{name} ({os.path.basename(stats_path)})\n")
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(top_count)
+
+    summary_path = f"{prefix}.txt"
+    with open(summary_path, 'w', encoding='utf-8') as f:
+        f.write(summary.getvalue())
+    return summary_path
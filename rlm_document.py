@@ -0,0 +1,522 @@
+"""
+Reads Smiles (.rlm) documents and prepares their rows for the mileage form without depending on Qt.
+
+A document holds a list of rows. Each row holds the Date, From Location, To Location, Purpose,
+Parking, Miles, and Round Trip columns as strings. Rows that are empty except for padding have a
+date of None. Older documents may use two-digit years, abbreviated school names, or omit the
+Round Trip column.
+
+Documents are journals with one JSON value per line so that a save only appends the rows that
+changed (see save_document()):
+
+    {"format":"smiles-journal","version":1}     the header
+    [3,["02/18/2025","Adams","Sheldon","Meeting","","2.4","0"]]     row 3 is now this
+    [4,null]                                     row 4 is now padding
+    {"rows":12}                                  commit: the document has 12 rows
+
+Rows that aren't in the journal are padding. Records after the last commit are the remains of a
+save that didn't finish and are ignored, so the previously saved rows are always intact. Older
+documents are a single JSON list of the rows and are still read.
+
+Long logs can be saved in a compact binary form instead (see encode_binary()), which holds exactly
+the same rows and is recognized by the BINARY_MAGIC at the start of the file.
+
+
+Disclaimer of Warranty
+
+This software is provided "as is," without any warranties of any kind, either express or implied,
+including but not limited to the implied warranties of merchantability, fitness for a particular
+purpose, or non-infringement. The entire risk arising out of the use or performance of the software
+remains with you. In no event shall the software provider be liable for any direct, indirect,
+incidental, special, consequential, or punitive damages whatsoever arising out of or in connection
+with the use or inability to use the software.
+"""
+import sys
+import os
+import re
+import json
+import struct
+from array import array
+from datetime import date, datetime
+from functools import lru_cache
+from itertools import chain
+
+
+__version__ = "1.2.0"
+__date__ = "Oct '26"
+
+DATE_COL_INDEX = 0
+FROM_COL_INDEX = 1
+TO_COL_INDEX = 2
+PURPOSE_COL_INDEX = 3
+PARKING_COL_INDEX = 4
+MILES_COL_INDEX = 5
+ROUND_TRIP_COL_INDEX = 6
+COL_COUNT = 7
+
+DATE_STR_FORMAT = "%m/%d/%Y" # Equivalent to QDate's toString("MM/dd/yyyy")
+OLD_DATE_STR_FORMAT = "%m/%d/%y"
+
+# The table of 'official' distances between schools doesn't use abbreviations
+# so the old names will be expanded when they encountered in data files.
+UPDATED_SCHOOL_NAMES = {
+    "North": "North Eugene",
+    "South": "South Eugene",
+    "CI": "Chinese Immersion",
+    "YG": "Yujin Gakuen"
+}
+
+
+JOURNAL_HEADER = {"format": "smiles-journal", "version": 1}
+PADDING_ROW = [None, '', '', '', '', '', '0']
+
+# Once the journal has this many more records than the document has rows (and at least
+# COMPACT_MIN_RECORDS), the next save rewrites it with only one record per row.
+COMPACT_RATIO = 2
+COMPACT_MIN_RECORDS = 100
+
+BINARY_MAGIC = b'SMRLM'
+BINARY_VERSION = 2
+
+# The header is the magic, version, number of strings, number of rows, and size of the string
+# table, which is the UTF-8 strings separated by NUL bytes with '' always first. The columns
+# follow, one after another: Date, From, To, and Purpose, Parking, and Miles as 32-bit values
+# (see encode_binary()) and Round Trip as a bit per row, starting with the lowest bit of the first
+# byte. Version 1 stored Round Trip as one byte per row and is still read.
+_BINARY_HEADER = struct.Struct('<5sBIII')
+_BINARY_COLUMNS = 'iiiiii'
+# The Round Trip values of the 8 rows in each possible byte.
+_ROUND_TRIP_BITS = [tuple('1' if byte >> bit & 1 else '0' for bit in range(8))
+                        for byte in range(256)]
+
+_DATE_RE = re.compile(r"(\d\d)/(\d\d)/(\d\d\d\d)")
+_NUMBER_RE = re.compile(r"(0|[1-9]\d{0,4})(?:\.(\d{1,3}))?")
+
+
+class DocumentJournal:
+    """
+    What the last save or load of a journaled document left in its file: the rows, the number of
+    records, and the size and modification time of the file so a change made by someone else is
+    noticed before anything is appended.
+    """
+
+    def __init__(self, path, rows, records, size, mtime_ns):
+        self.path = path
+        self.rows = rows
+        self.records = records
+        self.size = size
+        self.mtime_ns = mtime_ns
+
+    def matches_file(self, path):
+        """Returns True if path is still exactly the file that this journal describes."""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return False
+        return (os.path.abspath(path) == os.path.abspath(self.path) and
+                    st.st_size == self.size and st.st_mtime_ns == self.mtime_ns)
+
+
+def _dump_record(record):
+    return (json.dumps(record, ensure_ascii=False, separators=(',', ':')) + '\n').encode('utf-8')
+
+
+def _read_journal(path, data):
+    """Returns a DocumentJournal with the rows as of the last complete commit in data."""
+    rows = []
+    pending = {}
+    records = 0
+    pending_records = 0
+    size = 0
+    lines = data.split(b'\n')
+    # The header was already checked. The last element is whatever followed the final newline,
+    # which is never a complete record. Anything that can't be read ends the journal.
+    pos = len(lines[0]) + 1
+    for line in lines[1:-1]:
+        pos += len(line) + 1
+        try:
+            record = json.loads(line)
+        except ValueError:
+            break
+        if (isinstance(record, list) and len(record) == 2 and isinstance(record[0], int) and
+                record[0] >= 0 and (record[1] is None or isinstance(record[1], list))):
+            pending[record[0]] = record[1]
+            pending_records += 1
+        elif (isinstance(record, dict) and isinstance(record.get('rows'), int) and
+                record['rows'] >= 0):
+            count = record['rows']
+            rows = rows[:count] + [None] * (count - len(rows))
+            for i, row in pending.items():
+                if i < count:
+                    rows[i] = row
+            pending = {}
+            records += pending_records
+            pending_records = 0
+            size = pos
+        else:
+            break
+    rows = [list(PADDING_ROW) if row is None else row for row in rows]
+    return DocumentJournal(path, rows, records, size, None)
+
+
+def _encode_date(value, string_id):
+    if value is None:
+        return 0
+    m = _DATE_RE.fullmatch(value)
+    if m:
+        try:
+            return date(int(m[3]), int(m[1]), int(m[2])).toordinal()
+        except ValueError:
+            pass
+    return -1 - string_id(value)
+
+
+def _decode_dates(values, strings):
+    # Each distinct date is only converted once.
+    decoded = {0: None}
+    for value in set(values):
+        if value < 0:
+            decoded[value] = strings[-1 - value]
+        elif value:
+            d = date.fromordinal(value)
+            decoded[value] = "%02d/%02d/%04d" % (d.month, d.day, d.year)
+    return list(map(decoded.__getitem__, values))
+
+
+def _encode_number(value, string_id):
+    m = _NUMBER_RE.fullmatch(value)
+    if not m:
+        return -1 - string_id(value)
+    fraction = m[2] or ''
+    return int(m[1] + fraction) << 2 | len(fraction)
+
+
+def _decode_numbers(values, strings):
+    # Each distinct number is only converted once.
+    decoded = {}
+    for value in set(values):
+        if value < 0:
+            decoded[value] = strings[-1 - value]
+        else:
+            number, scale = value >> 2, value & 3
+            if scale:
+                digits = str(number).rjust(scale + 1, '0')
+                decoded[value] = f"{digits[:-scale]}.{digits[-scale:]}"
+            else:
+                decoded[value] = str(number)
+    return list(map(decoded.__getitem__, values))
+
+
+def encode_binary(rows):
+    """
+    Returns the rows in the compact binary form. Every distinct string is stored once and the
+    columns refer to it by id. A date in DATE_STR_FORMAT is its day number (0 is None), and
+    Parking and Miles that are plain numbers are stored in fixed point with the number of decimal
+    places in the low two bits. Anything else is stored as -1 - the id of its string, so
+    decode_binary() returns exactly the same rows. Raises ValueError if a row can't be stored
+    this way (e.g. it's missing a column).
+    """
+    strings = {'': 0}
+
+    def string_id(value):
+        if not isinstance(value, str) or '\0' in value:
+            raise ValueError(f"{value!r} can't be stored in the compact form.")
+        i = strings.get(value)
+        if i is None:
+            i = strings[value] = len(strings)
+        return i
+
+    columns = [array(typecode) for typecode in _BINARY_COLUMNS]
+    round_trips = bytearray(len(rows) + 7 >> 3)
+    for i, row in enumerate(rows):
+        if len(row) != COL_COUNT or row[ROUND_TRIP_COL_INDEX] not in ('0', '1'):
+            raise ValueError(f"{row!r} can't be stored in the compact form.")
+        columns[DATE_COL_INDEX].append(_encode_date(row[DATE_COL_INDEX], string_id))
+        for col in (FROM_COL_INDEX, TO_COL_INDEX, PURPOSE_COL_INDEX):
+            columns[col].append(string_id(row[col]))
+        for col in (PARKING_COL_INDEX, MILES_COL_INDEX):
+            columns[col].append(_encode_number(row[col], string_id))
+        if row[ROUND_TRIP_COL_INDEX] == '1':
+            round_trips[i >> 3] |= 1 << (i & 7)
+    if sys.byteorder != 'little':
+        for column in columns:
+            column.byteswap()
+    table = '\0'.join(strings).encode('utf-8')
+    header = _BINARY_HEADER.pack(BINARY_MAGIC, BINARY_VERSION, len(strings), len(rows),
+                                    len(table))
+    return b''.join([header, table] + [column.tobytes() for column in columns] + [round_trips])
+
+
+def decode_binary(data):
+    """Returns the rows from encode_binary(). Equal strings in the rows are the same object."""
+    try:
+        magic, version, string_count, row_count, table_size = _BINARY_HEADER.unpack_from(data)
+    except struct.error:
+        raise ValueError("The file isn't a document.")
+    if magic != BINARY_MAGIC:
+        raise ValueError("The file isn't a document.")
+    if version > BINARY_VERSION:
+        raise ValueError("The document was saved by a newer version.")
+    columns = [array(typecode) for typecode in _BINARY_COLUMNS]
+    round_trip_size = row_count if version < 2 else row_count + 7 >> 3
+    pos = _BINARY_HEADER.size + table_size
+    if len(data) != (pos + sum(column.itemsize for column in columns) * row_count +
+                        round_trip_size):
+        raise ValueError("The document is incomplete.")
+    strings = data[_BINARY_HEADER.size:pos].decode('utf-8').split('\0')
+    if len(strings) != string_count:
+        raise ValueError("The document is damaged.")
+    for column in columns:
+        end = pos + column.itemsize * row_count
+        column.frombytes(data[pos:end])
+        if sys.byteorder != 'little':
+            column.byteswap()
+        pos = end
+
+    try:
+        if version < 2:
+            round_trips = list(map(('0', '1').__getitem__, data[pos:]))
+        else:
+            round_trips = list(chain.from_iterable(map(_ROUND_TRIP_BITS.__getitem__, data[pos:])))
+            del round_trips[row_count:]
+        values = [
+            _decode_dates(columns[DATE_COL_INDEX], strings),
+            list(map(strings.__getitem__, columns[FROM_COL_INDEX])),
+            list(map(strings.__getitem__, columns[TO_COL_INDEX])),
+            list(map(strings.__getitem__, columns[PURPOSE_COL_INDEX])),
+            _decode_numbers(columns[PARKING_COL_INDEX], strings),
+            _decode_numbers(columns[MILES_COL_INDEX], strings),
+            round_trips,
+        ]
+    except (IndexError, ValueError, OverflowError):
+        raise ValueError("The document is damaged.")
+    return list(map(list, zip(*values)))
+
+
+def is_binary_document(path):
+    """Returns True if path is a document in the compact binary form."""
+    try:
+        with open(path, 'rb') as f:
+            return f.read(len(BINARY_MAGIC)) == BINARY_MAGIC
+    except OSError:
+        return False
+
+
+def load_document(path):
+    """
+    Returns (rows, journal) for a document. journal is the DocumentJournal to pass to the next
+    save_document(), or None if the document was in the older format or the compact binary form.
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+        mtime_ns = os.fstat(f.fileno()).st_mtime_ns
+    if data.startswith(BINARY_MAGIC):
+        return (decode_binary(data), None)
+    if data.lstrip()[:1] == b'[':
+        return (json.loads(data.decode('utf-8')), None)
+    header_end = data.find(b'\n')
+    try:
+        header = json.loads(data[:header_end if header_end >= 0 else len(data)])
+    except ValueError:
+        header = None
+    if not isinstance(header, dict) or header.get('format') != JOURNAL_HEADER['format']:
+        raise ValueError("The file isn't a document.")
+    if header.get('version', 0) > JOURNAL_HEADER['version']:
+        raise ValueError("The document was saved by a newer version.")
+    journal = _read_journal(path, data)
+    # A file that ends with an unfinished save can't be appended to as is.
+    journal.mtime_ns = mtime_ns if journal.size == len(data) else None
+    return ([list(row) for row in journal.rows], journal)
+
+
+def read_document(path):
+    """Returns the list of rows stored in a document."""
+    return load_document(path)[0]
+
+
+def replace_file(path, data):
+    """
+    Writes data to a temporary file next to path and then replaces path with it so the file is
+    never partially written.
+    """
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def _write_compacted(path, rows):
+    """Writes the whole journal with one record per row that isn't padding."""
+    chunks = [_dump_record(JOURNAL_HEADER)]
+    for i, row in enumerate(rows):
+        if row != PADDING_ROW:
+            chunks.append(_dump_record([i, row]))
+    chunks.append(_dump_record({'rows': len(rows)}))
+    replace_file(path, b''.join(chunks))
+    st = os.stat(path)
+    return DocumentJournal(path, rows, len(chunks) - 2, st.st_size, st.st_mtime_ns)
+
+
+def save_document(path, rows, journal=None, binary=None):
+    """
+    Saves the rows to path and returns the DocumentJournal to pass to the next call. If journal
+    came from the last save or load of the same file, only the rows that changed since then are
+    appended, followed by a commit record. Otherwise (or when the journal has grown too long) the
+    whole document is written to a temporary file that replaces path.
+
+    If binary is True the document is written in the compact binary form instead and None is
+    returned. If it's None, a document that's already in the binary form stays that way unless
+    the rows can't be stored in it.
+    """
+    rows = [list(row) for row in rows]
+    if binary or (binary is None and journal is None and is_binary_document(path)):
+        try:
+            data = encode_binary(rows)
+        except ValueError:
+            if binary:
+                raise
+        else:
+            replace_file(path, data)
+            return None
+    if (journal is None or not journal.matches_file(path) or
+            journal.records > max(COMPACT_MIN_RECORDS, COMPACT_RATIO * len(rows))):
+        return _write_compacted(path, rows)
+
+    chunks = []
+    for i, row in enumerate(rows):
+        if i >= len(journal.rows) or row != journal.rows[i]:
+            chunks.append(_dump_record([i, None if row == PADDING_ROW else row]))
+    if not chunks and len(rows) == len(journal.rows):
+        return journal
+    chunks.append(_dump_record({'rows': len(rows)}))
+    with open(path, 'r+b') as f:
+        f.seek(journal.size)
+        f.write(b''.join(chunks))
+        f.truncate()
+        f.flush()
+        os.fsync(f.fileno())
+    st = os.stat(path)
+    return DocumentJournal(path, rows, journal.records + len(chunks) - 1, st.st_size,
+                            st.st_mtime_ns)
+
+
+def save_recovery(path, rows, doc_path):
+    """
+    Writes a snapshot of unsaved rows (and the path of the document they belong to, if any) for
+    load_recovery() after a crash. The file is replaced all at once so it's never partially
+    written.
+    """
+    data = {'doc_path': doc_path, 'time': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                'rows': rows}
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def load_recovery(path):
+    """Returns (rows, doc_path, time_str) from save_recovery(), or None if there isn't any."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return (data['rows'], data.get('doc_path'), data.get('time', ''))
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def update_school_names(rows):
+    """Expands abbreviated school names in place."""
+    for row in rows:
+        name = row[FROM_COL_INDEX]
+        if name in UPDATED_SCHOOL_NAMES:
+            row[FROM_COL_INDEX] = UPDATED_SCHOOL_NAMES[name]
+        name = row[TO_COL_INDEX]
+        if name in UPDATED_SCHOOL_NAMES:
+            row[TO_COL_INDEX] = UPDATED_SCHOOL_NAMES[name]
+    return rows
+
+
+@lru_cache(maxsize=4096)
+def _parse_date(value):
+    # Documents repeat the same dates, so each is only parsed once.
+    try:
+        return datetime.strptime(value, DATE_STR_FORMAT).date()
+    except ValueError:
+        pass
+    try:
+        d = datetime.strptime(value, OLD_DATE_STR_FORMAT).date()
+        return d.replace(year=2000 + d.year % 100)
+    except ValueError:
+        return None
+
+
+def parse_date(value):
+    """
+    Returns value as a date. Two-digit years are always treated as 20xx, the same way the GUI
+    handles them. Missing or unreadable dates become today's date.
+    """
+    return (_parse_date(value) if value else None) or date.today()
+
+
+def normalize_date(value):
+    """Returns value using DATE_STR_FORMAT, see parse_date()."""
+    return parse_date(value).strftime(DATE_STR_FORMAT)
+
+
+def row_is_empty(row):
+    """Matches the GUI's notion of an empty row: nothing but a date and an unchecked box."""
+    return (''.join(row[FROM_COL_INDEX:ROUND_TRIP_COL_INDEX]) == '' and
+                row[ROUND_TRIP_COL_INDEX] != '1')
+
+
+def official_miles(distances, origin, dest):
+    """Returns the miles that the GUI would fill in for a trip, or None if they must be typed."""
+    if origin and dest:
+        if origin.upper() == dest.upper():
+            return '0'
+        if distances:
+            dist = distances.find(origin, dest)
+            if dist:
+                return str(dist)
+    return None
+
+
+def document_trips(rows):
+    """
+    Yields (index, day, row) for each row of a document that isn't empty (see row_is_empty()).
+    The rows are copies that are padded to COL_COUNT and have their school names updated, and day
+    is the row's date (see parse_date()).
+    """
+    for i, row in enumerate(rows):
+        row = [v if v is not None else '' for v in row]
+        row += ['0'] * (COL_COUNT - len(row))
+        if row_is_empty(row):
+            continue
+        update_school_names((row,))
+        yield (i, parse_date(row[DATE_COL_INDEX]), row)
+
+
+def prepare_table(rows, distances):
+    """
+    Returns the rows that belong on the form, the same way the GUI would present them: names are
+    updated, empty rows are dropped, dates are normalized, and official distances replace any
+    typed miles. Raises ValueError if a row is missing a required value.
+    """
+    table = []
+    for _, day, row in document_trips(rows):
+        row[DATE_COL_INDEX] = day.strftime(DATE_STR_FORMAT)
+        table.append(row)
+
+    for i, row in enumerate(table):
+        miles = official_miles(distances, row[FROM_COL_INDEX], row[TO_COL_INDEX])
+        if miles is not None:
+            row[MILES_COL_INDEX] = miles
+        for col, name in ((FROM_COL_INDEX, 'From'), (TO_COL_INDEX, 'To'),
+                                (MILES_COL_INDEX, 'Miles')):
+            if not row[col]:
+                raise ValueError(f"Line {i + 1} doesn't have a value for the '{name}' column.")
+    return table
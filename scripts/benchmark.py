@@ -0,0 +1,549 @@
+"""
+Times the slow parts of Smiles without showing any windows and prints the results as JSON so
+releases can be compared:
+
+    $ python3 scripts/benchmark.py [--repeat N] [--only NAME] [--out RESULTS.json]
+
+With --importtime it only checks that importing the app stays within IMPORT_BUDGETS_MS and doesn't
+import PyMuPDF or SQLite, and exits with 1 if it doesn't (e.g. as a check before a release):
+
+    $ python3 scripts/benchmark.py --importtime [--budget smiles=200]
+
+With --check it only checks that the app still behaves the way it was optimized to, and exits
+with 1 if it doesn't (see the check_* functions):
+
+    $ python3 scripts/benchmark.py --check
+
+Each result has the number of runs along with the min, median, mean, p90, p95, and max times in
+milliseconds. The documents that are opened are generated from the bundled distance table so the
+results don't depend on anyone's own files.
+
+
+Disclaimer of Warranty
+
+This software is provided "as is," without any warranties of any kind, either express or implied,
+including but not limited to the implied warranties of merchantability, fitness for a particular
+purpose, or non-infringement. The entire risk arising out of the use or performance of the software
+remains with you. In no event shall the software provider be liable for any direct, indirect,
+incidental, special, consequential, or punitive damages whatsoever arising out of or in connection
+with the use or inability to use the software.
+"""
+import sys
+import os
+import argparse
+import contextlib
+import json
+import math
+import platform
+import random
+import statistics
+import subprocess
+import tempfile
+import time
+from importlib import metadata
+from datetime import date, timedelta
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_DIR)
+
+# Newer versions of PyMuPDF print warnings to stdout, which would corrupt the JSON.
+with contextlib.redirect_stdout(sys.stderr):
+    import app_data
+    import pdf_parser
+    import pdf_writer
+    import rlm_document
+    import trip_history
+    from widget_data import PAGE_1_ROW_RECTS, get_row_rect
+
+
+__version__ = "1.0.0"
+__date__ = "Oct '26"
+
+USER_INFO = {"Name": "Benchmark", "Employee Number": "12345", "Building/Department": "Mentors",
+    "Account Number": "000-000"}
+
+FILL_FORM_ROWS = [1, pdf_writer.NUM_ROWS_PAGE_1, pdf_writer.ROWS_PER_FORM_SET]
+TABLE_ROWS = [pdf_writer.ROWS_PER_FORM_SET, 3 * pdf_writer.ROWS_PER_FORM_SET]
+DOCUMENT_ROWS = [10, pdf_writer.ROWS_PER_FORM_SET, 3 * pdf_writer.ROWS_PER_FORM_SET]
+# About five school years of trips.
+LOG_ROWS = 2000
+# The history that the suggestions are looked up in is as big as it gets.
+HISTORY_DOCUMENTS = trip_history.MAX_DOCUMENTS
+# The number of values that check_font_sizes() draws.
+FONT_CHECK_VALUES = 300
+
+# The most that importing each module may take, in milliseconds, and the modules that must not be
+# imported until they're needed. See check_import_budgets().
+IMPORT_BUDGETS_MS = {'smiles': 150, 'smiles_cli': 120}
+DEFERRED_MODULES = ['fitz', 'pymupdf', 'sqlite3']
+
+PURPOSES = ["Mentoring meeting", "Meeting", "Observation", "Classroom visit", "Office"]
+
+
+def _percentile(sorted_values, fraction):
+    """Linear interpolation between the closest ranks."""
+    if len(sorted_values) == 1:
+        return sorted_values[0]
+    pos = fraction * (len(sorted_values) - 1)
+    lower = math.floor(pos)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (pos - lower)
+
+
+def summarize(times):
+    """Returns the statistics for a list of times in seconds, in milliseconds."""
+    values = sorted(t * 1000 for t in times)
+    return {
+        'runs': len(values),
+        'min_ms': round(values[0], 3),
+        'median_ms': round(statistics.median(values), 3),
+        'mean_ms': round(statistics.fmean(values), 3),
+        'p90_ms': round(_percentile(values, 0.90), 3),
+        'p95_ms': round(_percentile(values, 0.95), 3),
+        'max_ms': round(values[-1], 3),
+    }
+
+
+@contextlib.contextmanager
+def separate_settings(directory):
+    """
+    Puts the settings file, and the recovery file, history, and archive next to it, in directory
+    so the benchmarks never touch the user's own.
+    """
+    get_settings_path = app_data.get_settings_path
+    app_data.get_settings_path = lambda: os.path.join(directory, 'settings.json')
+    try:
+        yield
+    finally:
+        app_data.get_settings_path = get_settings_path
+
+
+def time_calls(func, repeat, setup=None):
+    """Returns the times of repeat calls of func(). setup() is called (untimed) before each."""
+    times = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def make_trips(distances, count, seed=0):
+    """Returns count rows of realistic trips in the document format, one or two per school day."""
+    rnd = random.Random(seed)
+    names = list(distances.keys())
+    day = date(2025, 1, 6)
+    rows = []
+    while len(rows) < count:
+        if day.weekday() < 5:
+            for _ in range(rnd.randint(1, 2)):
+                origin, dest = rnd.sample(names, 2)
+                dist = distances.find(origin, dest)
+                rows.append([day.strftime(rlm_document.DATE_STR_FORMAT), origin, dest,
+                    rnd.choice(PURPOSES), rnd.choice(['', '', '2.50']),
+                    str(dist) if dist else '3.2', rnd.choice(['0', '1'])])
+        day += timedelta(days=1)
+    return rows[:count]
+
+
+def bench_parse(results, repeat, distances_path):
+    results['parse_distance_table'] = summarize(time_calls(
+        lambda: pdf_parser.parse_distance_table(distances_path), repeat))
+
+
+def bench_fill_form(results, repeat, distances, out_dir):
+    form_path = app_data.get_artifact_path(app_data.FORM_FILE)
+    add_form_path = app_data.get_artifact_path(app_data.ADDITIONAL_FORM_FILE)
+    out_path = os.path.join(out_dir, 'benchmark.pdf')
+    # The first call pays for preparing the templates, which is timed on its own.
+    pdf_writer._templates.clear()
+    table = make_trips(distances, 1)
+    results['fill_form first call'] = summarize(time_calls(
+        lambda: pdf_writer.fill_form(form_path, add_form_path, out_path,
+                                        {"USER_INFO": USER_INFO, "TABLE": table}),
+        1))
+    for count in FILL_FORM_ROWS:
+        table = make_trips(distances, count)
+        results[f'fill_form {count} rows'] = summarize(time_calls(
+            lambda: pdf_writer.fill_form(form_path, add_form_path, out_path,
+                                            {"USER_INFO": USER_INFO, "TABLE": table}),
+            repeat))
+
+
+def bench_load(results, repeat, distances, out_dir):
+    rows = make_trips(distances, LOG_ROWS, seed=LOG_ROWS)
+    paths = {}
+    for name, binary in (('journal', False), ('compact', True)):
+        paths[name] = os.path.join(out_dir, f'log_{name}.{app_data.APP_EXT}')
+        rlm_document.save_document(paths[name], rows, binary=binary)
+    paths['json'] = os.path.join(out_dir, f'log_json.{app_data.APP_EXT}')
+    with open(paths['json'], 'w', encoding='utf-8') as f:
+        json.dump(rows, f, indent=4)
+    for name, path in paths.items():
+        result = summarize(time_calls(lambda: rlm_document.load_document(path), repeat))
+        result['bytes'] = os.path.getsize(path)
+        results[f'load_document {name} {LOG_ROWS} rows'] = result
+
+
+def bench_history(results, repeat, distances, out_dir):
+    documents = [make_trips(distances, DOCUMENT_ROWS[-1], seed=i)
+                    for i in range(HISTORY_DOCUMENTS)]
+    history = trip_history.TripHistory(PURPOSES)
+    for i, rows in enumerate(documents):
+        history.update_document(os.path.join(out_dir, f'history{i}.{app_data.APP_EXT}'), rows)
+    results[f'TripHistory.update_document {DOCUMENT_ROWS[-1]} rows'] = summarize(time_calls(
+        lambda: history.update_document(os.path.join(out_dir, f'history0.{app_data.APP_EXT}'),
+                                            documents[0]),
+        repeat))
+    path = os.path.join(out_dir, app_data.HISTORY_FILE)
+    result = summarize(time_calls(lambda: history.save(path), repeat))
+    result['bytes'] = os.path.getsize(path)
+    results[f'TripHistory.save {HISTORY_DOCUMENTS} documents'] = result
+    results[f'TripHistory.load {HISTORY_DOCUMENTS} documents'] = summarize(time_calls(
+        lambda: trip_history.TripHistory.load(path, PURPOSES), repeat))
+    origin = history.likely_origins(1)[0]
+    results['TripHistory.purpose_matches'] = summarize(time_calls(
+        lambda: history.purpose_matches('me', 50), repeat))
+    results['TripHistory.likely_destinations'] = summarize(time_calls(
+        lambda: history.likely_destinations(origin, 5), repeat))
+
+
+def bench_gui(results, repeat, distances, out_dir):
+    # Qt is only imported if the GUI benchmarks run.
+    from PyQt6.QtWidgets import QApplication
+    import smiles
+
+    app = QApplication.instance() or QApplication([])
+    window = smiles.MainWindow(distances, USER_INFO)
+    model = window.table_model
+
+    for count in TABLE_ROWS:
+        trips = make_trips(distances, count)
+        window._clear_table()
+        window._write_table(trips)
+        window._update_table(False, all_rows=True)
+        results[f'MainWindow._read_table {count} rows'] = summarize(time_calls(
+            window._read_table, repeat))
+        results[f'MainWindow._write_table {count} rows'] = summarize(time_calls(
+            lambda: window._write_table(trips), repeat, window._clear_table))
+        window._write_table(trips)
+        results[f'MainWindow._update_table all rows {count} rows'] = summarize(time_calls(
+            lambda: window._update_table(all_rows=True), repeat))
+
+        # Alternate between two destinations so every edit actually changes the row.
+        row = count // 2
+        dests = [trips[row][window.TO_COL_INDEX], trips[row - 1][window.TO_COL_INDEX]]
+        def edit_one_row():
+            dests.reverse()
+            model.set_text(row, window.TO_COL_INDEX, dests[0])
+        results[f'MainWindow._update_table one edit {count} rows'] = summarize(time_calls(
+            window._update_table, repeat, edit_one_row))
+
+    for count in DOCUMENT_ROWS:
+        path = os.path.join(out_dir, f'benchmark_{count}.{app_data.APP_EXT}')
+        rlm_document.save_document(path, make_trips(distances, count, seed=count))
+        window._clear_table()
+        model.mark_saved()
+        results[f'MainWindow.open_file {count} rows'] = summarize(time_calls(
+            lambda: window.open_file(path), repeat))
+
+    path = os.path.join(out_dir, f'benchmark_log.{app_data.APP_EXT}')
+    rlm_document.save_document(path, make_trips(distances, LOG_ROWS, seed=LOG_ROWS), binary=True)
+    results[f'MainWindow.open_file compact {LOG_ROWS} rows'] = summarize(time_calls(
+        lambda: window.open_file(path), repeat))
+
+    # Don't let the window ask about saving changes.
+    model.mark_saved()
+    window.close()
+    app.processEvents()
+
+
+def _largest_font_size(pdf, rect, value, alignment):
+    """Tries each font size in turn, the way the form was filled in before _fit_font_size()."""
+    page = pdf.new_page()
+    font_size = pdf_writer.DEFAULT_FONT_SIZE
+    while (page.insert_textbox(rect, value, fontsize=font_size, align=alignment) < 0 and
+            font_size > pdf_writer.FONT_SIZE_DECREMENT):
+        font_size -= pdf_writer.FONT_SIZE_DECREMENT
+    return font_size
+
+
+def check_font_sizes(results, repeat):
+    """
+    Draws FONT_CHECK_VALUES values (words of random lengths with leading and trailing spaces) in
+    the text fields of the first row and returns a list of failures: each must be drawn with the
+    same font size that trying every size in turn finds.
+    """
+    import fitz
+    rnd = random.Random(0)
+    characters = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789."
+    pdf = fitz.open()
+    failures = []
+    times = []
+    for _ in range(FONT_CHECK_VALUES):
+        col = rnd.randrange(0, pdf_writer.PARKING_COL_INDEX)
+        rect = get_row_rect(PAGE_1_ROW_RECTS, 0, col)
+        words = [''.join(rnd.choice(characters) for _ in range(rnd.randint(1, 14)))
+                    for _ in range(rnd.randint(1, 3))]
+        value = ' ' + ' '.join(words) + ' ' * rnd.randint(0, 3)
+        expected = _largest_font_size(pdf, rect, value, fitz.TEXT_ALIGN_LEFT)
+
+        page = pdf.new_page()
+        pdf_writer._fit_font_size.cache_clear()
+        start = time.perf_counter()
+        pdf_writer._insert_text(page, rect, value, fitz.TEXT_ALIGN_LEFT)
+        times.append(time.perf_counter() - start)
+        sizes = {span['size'] for block in page.get_text('dict')['blocks']
+                    for line in block.get('lines', ()) for span in line['spans']}
+        if sizes != {expected}:
+            failures.append(f"{value!r} was drawn at {sorted(sizes)} instead of {expected}.")
+    pdf.close()
+    results[f'font sizes {FONT_CHECK_VALUES} values'] = summarize(times)
+    return failures
+
+
+def check_date_propagation(results, repeat):
+    """
+    Changes the first date of an empty table repeat times and adds the number of signals that
+    each change caused. Returns a list of failures: the change must be handled once and reach the
+    rows below it in a single dataChanged (along with the one for the edited cell).
+    """
+    from PyQt6.QtCore import QDate
+    from PyQt6.QtWidgets import QApplication
+    import smiles
+
+    class CountingWindow(smiles.MainWindow):
+        date_changed_calls = 0
+
+        def _on_date_changed(self, row, date):
+            self.date_changed_calls += 1
+            super()._on_date_changed(row, date)
+
+    app = QApplication.instance() or QApplication([])
+    window = CountingWindow(None, USER_INFO)
+    model = window.table_model
+    while model.rowCount() < pdf_writer.ROWS_PER_FORM_SET:
+        window._grow_table()
+    data_changed = []
+    model.dataChanged.connect(lambda top_left, bottom_right, roles=():
+                                data_changed.append((top_left.row(), bottom_right.row())))
+
+    count = model.rowCount()
+    failures = []
+    times = []
+    for i in range(repeat):
+        window.date_changed_calls = 0
+        data_changed.clear()
+        date = QDate(2025, 1, 6).addDays(i + 1)
+        start = time.perf_counter()
+        model.set_date(0, date)
+        times.append(time.perf_counter() - start)
+        propagated = all(model.date(row) == date for row in range(1, count))
+        if (window.date_changed_calls != 1 or data_changed != [(0, 0), (1, count - 1)] or
+                not propagated):
+            failures.append(f"Changing the first date of {count} rows called _on_date_changed() " +
+                            f"{window.date_changed_calls} times and emitted {len(data_changed)} " +
+                            "dataChanged signals" + ("." if propagated else
+                                                        " without propagating it."))
+            break
+    result = summarize(times)
+    result['_on_date_changed calls'] = window.date_changed_calls
+    result['dataChanged signals'] = len(data_changed)
+    results[f'date propagation {count} rows'] = result
+
+    model.mark_saved()
+    window.close()
+    app.processEvents()
+    return failures
+
+
+def check_restyles(results, repeat, distances):
+    """
+    Fills the shown table with trips and updates every row of it repeat more times, counting the
+    dataChanged signals, the ones that restyle a cell, and the cells the delegate paints in each
+    pass. Returns a list of failures: only the first pass changes anything, so the others must not
+    emit or paint anything.
+    """
+    from PyQt6.QtWidgets import QApplication
+    import smiles
+
+    class CountingDelegate(smiles.TripItemDelegate):
+        paints = 0
+
+        def paint(self, painter, option, index):
+            CountingDelegate.paints += 1
+            super().paint(painter, option, index)
+
+    app = QApplication.instance() or QApplication([])
+    delegate_class = smiles.TripItemDelegate
+    smiles.TripItemDelegate = CountingDelegate
+    try:
+        window = smiles.MainWindow(distances, USER_INFO)
+    finally:
+        smiles.TripItemDelegate = delegate_class
+    model = window.table_model
+    window.show()
+    data_changed = []
+    model.dataChanged.connect(lambda top_left, bottom_right, roles=(): data_changed.append(roles))
+
+    trips = make_trips(distances, pdf_writer.ROWS_PER_FORM_SET)
+    window._clear_table()
+    window._write_table(trips)
+    app.processEvents()
+    failures = []
+    passes = []
+    for i in range(repeat + 1):
+        data_changed.clear()
+        CountingDelegate.paints = 0
+        start = time.perf_counter()
+        window._update_table(False, all_rows=True)
+        app.processEvents()
+        seconds = time.perf_counter() - start
+        restyles = sum(1 for roles in data_changed if list(roles) == model.STYLE_ROLES)
+        if i == 0:
+            results[f'restyles first _update_table {len(trips)} rows'] = {
+                'dataChanged signals': len(data_changed), 'restyles': restyles,
+                'delegate paints': CountingDelegate.paints}
+            continue
+        passes.append(seconds)
+        if data_changed or CountingDelegate.paints:
+            failures.append(f"Updating {len(trips)} rows that hadn't changed emitted " +
+                            f"{len(data_changed)} dataChanged signals ({restyles} restyles) and " +
+                            f"painted {CountingDelegate.paints} cells.")
+            break
+    result = summarize(passes)
+    result['dataChanged signals'] = len(data_changed)
+    result['restyles'] = restyles
+    result['delegate paints'] = CountingDelegate.paints
+    results[f'restyles unchanged _update_table {len(trips)} rows'] = result
+
+    model.mark_saved()
+    window.close()
+    app.processEvents()
+    return failures
+
+
+def measure_import(module):
+    """
+    Imports module in a fresh interpreter with -X importtime. Returns (seconds, names) where names
+    is the set of every module that was imported along with it.
+    """
+    proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                            cwd=REPO_DIR, capture_output=True, text=True, check=True)
+    seconds = None
+    names = set()
+    for line in proc.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith('import time:') or line.endswith('imported package'):
+            continue
+        _, cumulative, name = line.split('|')
+        names.add(name.strip())
+        if name == f' {module}':
+            seconds = int(cumulative) / 1e6
+    return seconds, names
+
+
+def check_import_budgets(results, repeat, budgets):
+    """
+    Times importing each module in budgets and adds the results. Returns a list of failures: a
+    median over the module's budget or one of the DEFERRED_MODULES being imported.
+    """
+    failures = []
+    for module, budget_ms in budgets.items():
+        times = []
+        names = set()
+        for _ in range(repeat):
+            seconds, imported = measure_import(module)
+            times.append(seconds)
+            names |= imported
+        result = summarize(times)
+        result['budget_ms'] = budget_ms
+        results[f'import {module}'] = result
+        if result['median_ms'] > budget_ms:
+            failures.append(f"Importing {module} took {result['median_ms']:.1f} ms, " +
+                                f"the budget is {budget_ms} ms.")
+        for name in DEFERRED_MODULES:
+            if name in names:
+                failures.append(f"Importing {module} also imported {name}.")
+    return failures
+
+
+def main(argv=None):
+    """Returns a process exit code."""
+    parser = argparse.ArgumentParser(description="Time the slow parts of Smiles.")
+    parser.add_argument('--repeat', metavar='N', type=int, default=10,
+        help="the number of times to run each benchmark (default: 10)")
+    parser.add_argument('--only', metavar='NAME',
+        choices=['parse', 'fill', 'load', 'history', 'gui'], action='append',
+        help="only run the parse, fill, load, history, or gui benchmarks (can be repeated)")
+    parser.add_argument('--out', metavar='PATH', help="write the JSON here instead of to stdout")
+    parser.add_argument('--importtime', action='store_true',
+        help="only check how long importing the app takes; exits with 1 if it's over budget")
+    parser.add_argument('--budget', metavar='MODULE=MS', action='append', default=[],
+        help="override the import budget of a module in milliseconds (can be repeated)")
+    parser.add_argument('--check', action='store_true',
+        help="only check that the optimizations still behave the same; exits with 1 if they don't")
+    args = parser.parse_args(argv)
+    groups = args.only or ['parse', 'fill', 'load', 'history', 'gui']
+
+    results = {}
+    failures = []
+    if args.importtime:
+        budgets = dict(IMPORT_BUDGETS_MS)
+        for budget in args.budget:
+            module, _, budget_ms = budget.partition('=')
+            budgets[module] = float(budget_ms)
+        failures = check_import_budgets(results, args.repeat, budgets)
+    elif args.check:
+        with tempfile.TemporaryDirectory() as out_dir, contextlib.redirect_stdout(sys.stderr), \
+                separate_settings(os.path.join(out_dir, 'settings')):
+            failures = check_font_sizes(results, args.repeat)
+            failures += check_date_propagation(results, args.repeat)
+            distances = pdf_parser.DistanceIndex(pdf_parser.parse_distance_table(
+                app_data.get_artifact_path(app_data.DISTANCES_FILE)))
+            failures += check_restyles(results, args.repeat, distances)
+    else:
+        distances_path = app_data.get_artifact_path(app_data.DISTANCES_FILE)
+        with tempfile.TemporaryDirectory() as out_dir, contextlib.redirect_stdout(sys.stderr), \
+                separate_settings(os.path.join(out_dir, 'settings')):
+            distances = pdf_parser.DistanceIndex(pdf_parser.parse_distance_table(distances_path))
+            if 'parse' in groups:
+                bench_parse(results, args.repeat, distances_path)
+            if 'fill' in groups:
+                bench_fill_form(results, args.repeat, distances, out_dir)
+            if 'load' in groups:
+                bench_load(results, args.repeat, distances, out_dir)
+            if 'history' in groups:
+                bench_history(results, args.repeat, distances, out_dir)
+            if 'gui' in groups:
+                bench_gui(results, args.repeat, distances, out_dir)
+
+    report = {
+        'meta': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpus': os.cpu_count(),
+            'pymupdf': metadata.version('pymupdf'),
+            'repeat': args.repeat,
+            'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        },
+        'results': results,
+    }
+    if args.importtime or args.check:
+        report['failures'] = failures
+    text = json.dumps(report, indent=4)
+    if args.out:
+        with open(args.out, 'w', encoding='utf-8') as f:
+            f.write(text + '\n')
+    else:
+        print(text)
+    for failure in failures:
+        print(failure, file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -13,129 +13,672 @@ incidental, special, consequential, or punitive damages whatsoever arising out o
 with the use or inability to use the software.
 """
 import sys
+
+if __name__ == "__main__" and {'--fill', '--batch', '--convert'} & set(sys.argv):
+    # Headless mode, see smiles_cli.py. It's dispatched before Qt is imported so it works where
+    # PyQt6 isn't installed, and the bundled app (which only runs this script) can use it too.
+    import profiling
+    import smiles_cli
+    profiling.install(sys.argv, [(smiles_cli, 'main'), (smiles_cli, 'fill_form')])
+    sys.exit(smiles_cli.main(sys.argv[1:]))
+
 import os
-import platform
-import json
+import time
 import random
+import threading
 from PyQt6.QtGui import (QAction, QIcon, QColor, QPainter, QPen, QDoubleValidator, QPixmap,
-                                QFont, QDragEnterEvent, QDropEvent)
-from PyQt6.QtCore import Qt, QDate, QEvent, pyqtSignal
-from PyQt6.QtWidgets import (QApplication, QMainWindow, QTableWidget, QDateEdit, QDialog,
+                                QFont, QBrush, QDragEnterEvent, QDropEvent)
+from PyQt6.QtCore import (Qt, QDate, QEvent, QThread, QTimer, QAbstractTableModel,
+                                QAbstractListModel, QModelIndex, pyqtSignal)
+from PyQt6.QtWidgets import (QApplication, QMainWindow, QTableView, QDateEdit, QDialog,
                                 QMessageBox, QLineEdit, QCompleter, QPushButton, QVBoxLayout,
                                 QHBoxLayout, QWidget, QFormLayout, QLabel, QDialogButtonBox,
-                                QFileDialog, QStyle, QStyleOption, QFrame, QCheckBox)
-
-from pdf_writer import fill_form, MAX_ROWS
-from pdf_parser import parse_distance_table
+                                QFileDialog, QStyle, QStyleOption, QFrame, QStyledItemDelegate,
+                                QStyleOptionViewItem, QAbstractItemView, QAbstractItemDelegate,
+                                QProgressDialog, QTableWidget, QTableWidgetItem)
+
+from pdf_writer import fill_form, use_form_widgets, format_grand_total, FillCancelled
+from pdf_parser import load_distance_table, DistanceIndex
+from app_data import (APP_NAME, APP_EXT, BASE_DIR, ARTIFACTS_DIR, DISTANCES_FILE, FORM_FILE,
+                                ADDITIONAL_FORM_FILE, DISTANCES_CACHE_FILE, FORM_WIDGETS_CACHE_FILE,
+                                RECOVERY_FILE, ARCHIVE_FILE, HISTORY_FILE)
+from rlm_document import (update_school_names, load_document, save_document, save_recovery,
+                                load_recovery, parse_date)
+from completion_index import CompletionIndex
+from trip_history import TripHistory
+import app_data
+import profiling
 
 
 __version__ = "1.6.0"
 __date__ = "Feb '25"
 
-APP_NAME = "Smiles"
-APP_EXT = "rlm"
-BASE_DIR = os.path.dirname(__file__)
-ARTIFACTS_DIR = "artifacts"
 ICON_FILE = "mentor.png"
 ABOUT_IMG_PATH = "support.png"
-DISTANCES_FILE = "20250218_distances.pdf"
-FORM_FILE = "20250218_mileage.pdf"
-ADDITIONAL_FORM_FILE = "20250218_additional_mileage.pdf"
-
-# The table of 'official' distances between schools doesn't use abbreviations
-# so the old names will be expanded when they encountered in data files.
-UPDATED_SCHOOL_NAMES = {
-    "North": "North Eugene",
-    "South": "South Eugene",
-    "CI": "Chinese Immersion",
-    "YG": "Yujin Gakuen"
-}
 
 ROW_COLORS = [QColor("#40FF0018"), QColor("#40FFA52C"), QColor("#40FFFF41"),
         QColor("#40008018"), QColor("#400000F9"), QColor("#4086007D")]
 
 
-class CustomLineEdit(QLineEdit):
-    """Overrides the default paintEvent to draw box outlines in a specified color."""
+class TripTableModel(QAbstractTableModel):
+    """
+    Holds the contents of the trip table. Each row is a list with a QDate followed by the text of
+    the remaining columns; the Round Trip column holds '1' or '0' like the documents do. Nothing
+    here is a widget, the view's delegate only creates an editor while a cell is being edited.
+    """
+
+    dateChanged = pyqtSignal(int, QDate)
 
-    def __init__(self, row_index, parent=None):
+    DEFAULT_STYLE = (None, False)
+    STYLE_ROLES = [Qt.ItemDataRole.ForegroundRole, Qt.ItemDataRole.FontRole]
+    # Whether the Miles column can be edited, which changes its flags() but not the data.
+    READ_ONLY_ROLE = Qt.ItemDataRole.UserRole
+    _brushes_and_fonts = {}
+
+    def __init__(self, headers, row_count, parent=None):
         super().__init__(parent)
-        self.color = ROW_COLORS[row_index % len(ROW_COLORS)]
+        self.headers = headers
+        self.rows = [self._new_row() for _ in range(row_count)]
+        self.read_only = [False] * row_count
+        self.styles = {}
+        # What each row looked like when the document was last saved (see _row_key()) and the
+        # rows that are different now, so is_modified() doesn't need to look at the whole table.
+        self.saved_keys = []
+        self.modified_rows = set()
+
+    @staticmethod
+    def _new_row():
+        return [QDate.currentDate(), '', '', '', '', '', '0']
+
+    def _row_key(self, row):
+        """
+        Returns what a row contributes to the saved document: None for an empty row (since its
+        date isn't saved and trailing empty rows are dropped), otherwise the row's values.
+        """
+        if row >= len(self.rows):
+            return None
+        values = self.rows[row]
+        if values[1:] == ['', '', '', '', '', '0']:
+            return None
+        return tuple(values)
+
+    def _check_row(self, row):
+        saved = self.saved_keys[row] if row < len(self.saved_keys) else None
+        if self._row_key(row) == saved:
+            self.modified_rows.discard(row)
+        else:
+            self.modified_rows.add(row)
+
+    def mark_saved(self):
+        """Remembers the current contents as the saved version of the document."""
+        self.saved_keys = [self._row_key(i) for i in range(len(self.rows))]
+        self.modified_rows.clear()
+
+    def is_modified(self):
+        """Returns True if the document is different than when mark_saved() was last called."""
+        return bool(self.modified_rows)
+
+    def rowCount(self, parent=QModelIndex()):
+        """Part of the QAbstractTableModel interface."""
+        if parent.isValid():
+            return 0
+        return len(self.rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        """Part of the QAbstractTableModel interface."""
+        if parent.isValid():
+            return 0
+        return len(self.headers)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        """Part of the QAbstractTableModel interface."""
+        if role == Qt.ItemDataRole.DisplayRole:
+            if orientation == Qt.Orientation.Horizontal:
+                return self.headers[section]
+            return section + 1
+        return None
+
+    def flags(self, index):
+        """The Miles column is read-only while it shows an 'official' distance."""
+        flags = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+        col = index.column()
+        if col == MainWindow.ROUND_TRIP_COL_INDEX:
+            return flags | Qt.ItemFlag.ItemIsUserCheckable
+        if col == MainWindow.MILES_COL_INDEX and self.read_only[index.row()]:
+            return flags
+        return flags | Qt.ItemFlag.ItemIsEditable
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        """Part of the QAbstractTableModel interface."""
+        row = index.row()
+        col = index.column()
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            if col == MainWindow.ROUND_TRIP_COL_INDEX:
+                return None
+            return self.rows[row][col]
+        if role == Qt.ItemDataRole.CheckStateRole:
+            if col == MainWindow.ROUND_TRIP_COL_INDEX:
+                if self.rows[row][col] == '1':
+                    return Qt.CheckState.Checked
+                return Qt.CheckState.Unchecked
+            return None
+        if role == self.READ_ONLY_ROLE:
+            return col == MainWindow.MILES_COL_INDEX and self.read_only[row]
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            if col in (MainWindow.PARKING_COL_INDEX, MainWindow.MILES_COL_INDEX):
+                return Qt.AlignmentFlag.AlignCenter
+            return Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
+        if role == Qt.ItemDataRole.ForegroundRole:
+            style = self.styles.get((row, col), None)
+            if style:
+                return self._get_brush_and_font(style)[0]
+            return None
+        if role == Qt.ItemDataRole.FontRole:
+            style = self.styles.get((row, col), None)
+            if style:
+                return self._get_brush_and_font(style)[1]
+            return None
+        return None
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        """Called by the view's delegate as the user edits a cell."""
+        row = index.row()
+        col = index.column()
+        if col == MainWindow.ROUND_TRIP_COL_INDEX:
+            if role != Qt.ItemDataRole.CheckStateRole:
+                return False
+            if Qt.CheckState(value) == Qt.CheckState.Checked:
+                value = '1'
+            else:
+                value = '0'
+        elif role != Qt.ItemDataRole.EditRole:
+            return False
+        if self.rows[row][col] == value:
+            return True
+        self.rows[row][col] = value
+        self._check_row(row)
+        self.dataChanged.emit(index, index)
+        if col == MainWindow.DATE_COL_INDEX:
+            self.dateChanged.emit(row, value)
+        return True
+
+    def text(self, row, col):
+        """Returns the same text that the cell's widget would have."""
+        return self.rows[row][col]
+
+    def set_text(self, row, col, text):
+        """Sets the text of a cell that isn't the Date column. Round Trip uses '1' and '0'."""
+        if col == MainWindow.ROUND_TRIP_COL_INDEX:
+            if text == '1':
+                state = Qt.CheckState.Checked
+            else:
+                state = Qt.CheckState.Unchecked
+            self.setData(self.index(row, col), state, Qt.ItemDataRole.CheckStateRole)
+        else:
+            self.setData(self.index(row, col), text)
+
+    def date(self, row):
+        """Returns the QDate in the row's Date column."""
+        return self.rows[row][MainWindow.DATE_COL_INDEX]
+
+    def set_date(self, row, date):
+        """Sets the row's Date column and emits dateChanged if it's different."""
+        self.setData(self.index(row, MainWindow.DATE_COL_INDEX), date)
+
+    def set_dates(self, rows, date):
+        """
+        Sets the Date column of several rows at once. dateChanged isn't emitted, and a single
+        dataChanged covers all of the rows.
+        """
+        changed = [row for row in rows if self.rows[row][MainWindow.DATE_COL_INDEX] != date]
+        if not changed:
+            return
+        for row in changed:
+            self.rows[row][MainWindow.DATE_COL_INDEX] = date
+            self._check_row(row)
+        self.dataChanged.emit(self.index(changed[0], MainWindow.DATE_COL_INDEX),
+                                self.index(changed[-1], MainWindow.DATE_COL_INDEX))
+
+    def is_read_only(self, row, col):
+        """Returns True if the cell can't be edited or toggled."""
+        return not self.flags(self.index(row, col)) & (Qt.ItemFlag.ItemIsEditable |
+                                                            Qt.ItemFlag.ItemIsUserCheckable)
+
+    def set_read_only(self, row, read_only):
+        """Sets whether the row's Miles column can be edited."""
+        if self.read_only[row] == read_only:
+            return
+        self.read_only[row] = read_only
+        index = self.index(row, MainWindow.MILES_COL_INDEX)
+        self.dataChanged.emit(index, index, [self.READ_ONLY_ROLE])
 
-    def paintEvent(self, event):
-        """Override the default event to use a custom color."""
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        pen = QPen(self.color)
-        pen.setWidth(2)
-        painter.setPen(pen)
-        painter.drawRect(self.rect().adjusted(0, 0, -1, -1))
-        super().paintEvent(event)
+    def set_style(self, row, col, color=None, bold=False):
+        """
+        Sets the color and weight of a cell's text. Nothing is emitted (so nothing is repainted)
+        unless the style is different.
+        """
+        style = (color, bold)
+        if self.styles.get((row, col), self.DEFAULT_STYLE) == style:
+            return
+        if style == self.DEFAULT_STYLE:
+            del self.styles[(row, col)]
+        else:
+            self.styles[(row, col)] = style
+        index = self.index(row, col)
+        self.dataChanged.emit(index, index, self.STYLE_ROLES)
+
+    @classmethod
+    def _get_brush_and_font(cls, style):
+        """Returns the QBrush and QFont for a style, which are shared by all of its cells."""
+        if style not in cls._brushes_and_fonts:
+            color, bold = style
+            brush = QBrush(QColor(color)) if color else None
+            font = None
+            if bold:
+                font = QFont()
+                font.setBold(True)
+            cls._brushes_and_fonts[style] = (brush, font)
+        return cls._brushes_and_fonts[style]
+
+    def insertRows(self, row, count, parent=QModelIndex()):
+        """Part of the QAbstractTableModel interface."""
+        self.beginInsertRows(parent, row, row + count - 1)
+        for i in range(row, row + count):
+            self.rows.insert(i, self._new_row())
+            self.read_only.insert(i, False)
+        for i in range(row, len(self.rows)):
+            self._check_row(i)
+        self.endInsertRows()
+        return True
+
+    def set_rows(self, rows):
+        """
+        Replaces all of the rows at once, each a QDate followed by the other columns' text. Rows
+        are added or removed at the bottom as needed and then a single dataChanged covers the
+        whole table (dateChanged isn't emitted). The styles and read-only Miles are reset.
+        """
+        current = len(self.rows)
+        count = len(rows)
+        if count > current:
+            self.beginInsertRows(QModelIndex(), current, count - 1)
+        elif count < current:
+            self.beginRemoveRows(QModelIndex(), count, current - 1)
+        self.rows = rows
+        self.read_only = [False] * count
+        self.styles = {}
+        for i in range(max(count, current, len(self.saved_keys))):
+            self._check_row(i)
+        if count > current:
+            self.endInsertRows()
+        elif count < current:
+            self.endRemoveRows()
+        if rows:
+            self.dataChanged.emit(self.index(0, 0), self.index(count - 1, len(self.headers) - 1))
+
+
+class TripItemDelegate(QStyledItemDelegate):
+    """
+    Draws the colored box around each cell and creates the editors. Only the cell that is being
+    edited has an editor so the cost of the table doesn't depend on the number of rows.
+    """
+
+    advance = pyqtSignal()
+
+    def __init__(self, window):
+        super().__init__(window)
+        self.window = window
+
+    def paint(self, painter, option, index):
+        """Override the default to outline the cells in a color that depends on the row."""
+        super().paint(painter, option, index)
+        if index.column() != MainWindow.DATE_COL_INDEX:
+            painter.save()
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            pen = QPen(ROW_COLORS[index.row() % len(ROW_COLORS)])
+            pen.setWidth(2)
+            painter.setPen(pen)
+            painter.drawRect(option.rect.adjusted(1, 1, -1, -1))
+            painter.restore()
+
+    def initStyleOption(self, option, index):
+        """Center the Round Trip checkbox the way it was when it had its own widget."""
+        super().initStyleOption(option, index)
+        if index.column() == MainWindow.ROUND_TRIP_COL_INDEX:
+            option.displayAlignment = Qt.AlignmentFlag.AlignCenter
+            option.features &= ~QStyleOptionViewItem.ViewItemFeature.HasDisplay
+
+    def createEditor(self, parent, option, index):
+        """Creates the QDateEdit or QLineEdit for the cell that is about to be edited."""
+        col = index.column()
+        if col == MainWindow.DATE_COL_INDEX:
+            editor = QDateEdit(parent)
+            editor.setCalendarPopup(True)
+            # Commit right away so the date is propagated down the table while the editor is open.
+            editor.dateChanged.connect(lambda _: self.commitData.emit(editor))
+            return editor
+        if col == MainWindow.ROUND_TRIP_COL_INDEX:
+            return None
+
+        editor = QLineEdit(parent)
+        editor.setFrame(False)
+        # Keep the model up to date while typing, the same as when every cell was a widget.
+        editor.textEdited.connect(lambda _: self.commitData.emit(editor))
+        if col in (MainWindow.FROM_COL_INDEX, MainWindow.TO_COL_INDEX):
+            # The locations this trip most likely used are suggested first.
+            history = self.window.trip_history
+            if col == MainWindow.FROM_COL_INDEX:
+                suggestions = history.likely_origins(CompletionModel.MAX_SUGGESTIONS)
+            else:
+                origin = index.siblingAtColumn(MainWindow.FROM_COL_INDEX).data()
+                suggestions = history.likely_destinations(origin or '',
+                                                            CompletionModel.MAX_SUGGESTIONS)
+                if suggestions:
+                    editor.setPlaceholderText(suggestions[0])
+            self.window.school_completer.set_suggestions(suggestions)
+            editor.setCompleter(self.window.school_completer)
+        elif col == MainWindow.PURPOSE_COL_INDEX:
+            editor.setCompleter(self.window.purpose_completer)
+        else:
+            editor.setAlignment(Qt.AlignmentFlag.AlignCenter)
+            if col == MainWindow.PARKING_COL_INDEX:
+                editor.setValidator(self.window.money_validator)
+            else:
+                editor.setValidator(self.window.mileage_validator)
+        return editor
+
+    def setEditorData(self, editor, index):
+        """Only touch the editor if the model changed so the cursor isn't moved while typing."""
+        value = index.data(Qt.ItemDataRole.EditRole)
+        if isinstance(editor, QDateEdit):
+            if editor.date() != value:
+                editor.blockSignals(True)
+                editor.setDate(value)
+                editor.blockSignals(False)
+        elif editor.text() != value:
+            editor.setText(value)
+
+    def setModelData(self, editor, model, index):
+        """Part of the QStyledItemDelegate interface."""
+        if isinstance(editor, QDateEdit):
+            model.setData(index, editor.date())
+        else:
+            model.setData(index, editor.text())
 
+    def eventFilter(self, editor, event):
+        """
+        Return and Enter move to the next cell instead of just closing the editor. Tab always
+        leaves the cell, even if the validator thinks the value is unfinished. Down shows the
+        suggestions, even before anything has been typed.
+        """
+        if isinstance(editor, QLineEdit) and event.type() == QEvent.Type.KeyPress:
+            completer = editor.completer()
+            if (event.key() == Qt.Key.Key_Down and completer is not None and
+                    not completer.popup().isVisible()):
+                completer.setCompletionPrefix(editor.text())
+                completer.complete()
+                return True
+            if event.key() in (Qt.Key.Key_Return, Qt.Key.Key_Enter):
+                self.commitData.emit(editor)
+                self.advance.emit()
+                return True
+            if event.key() in (Qt.Key.Key_Tab, Qt.Key.Key_Backtab):
+                if event.key() == Qt.Key.Key_Tab:
+                    hint = QAbstractItemDelegate.EndEditHint.EditNextItem
+                else:
+                    hint = QAbstractItemDelegate.EndEditHint.EditPreviousItem
+                self.commitData.emit(editor)
+                self.closeEditor.emit(editor, hint)
+                return True
+        return super().eventFilter(editor, event)
 
-class CustomCheckBox(QWidget):
-    """Wraps a QCheckBox so it looks similar to the CustomLineEdit and provides the same methods"""
 
-    toggled = pyqtSignal(bool)
+class TripTableView(QTableView):
+    """Lets the Round Trip checkboxes be toggled with Return and Enter as well as Space."""
 
-    def __init__(self, row_index, parent=None):
+    def __init__(self, parent=None):
         super().__init__(parent)
-        self.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
-        self.setAutoFillBackground(True)
-        self.color = ROW_COLORS[row_index % len(ROW_COLORS)]
-        self.layout = QHBoxLayout(self)
-        self.layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.checkbox = QCheckBox(self)
-        self.checkbox.stateChanged.connect(self._on_checkbox_toggled)
-        self.layout.addWidget(self.checkbox)
-
-    def paintEvent(self, event):
-        """Override the default event to use a custom color."""
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        pen = QPen(self.color)
-        pen.setWidth(2)
-        painter.setPen(pen)
-        painter.drawRect(self.rect().adjusted(0, 0, -1, -1))
-        super().paintEvent(event)
-
-    def focusInEvent(self, _):
-        """Focus the checkbox since this widget isn't interactive"""
-        self.checkbox.setFocus()
+        self._tabbing = False
+
+    def focusNextPrevChild(self, next):
+        """
+        Override the default so a single Tab only moves one cell. Closing the old editor while a
+        completer's popup is open would otherwise ask the view to move a second time.
+        """
+        if self._tabbing:
+            return True
+        self._tabbing = True
+        try:
+            return super().focusNextPrevChild(next)
+        finally:
+            self._tabbing = False
 
     def keyPressEvent(self, event):
-        """Allow the user to toggle the checkbox using a the Space and Enter keys"""
-        if event.key() == Qt.Key.Key_Space:
-            self.checkbox.toggle()
-        elif event.key() == Qt.Key.Key_Enter or event.key() == Qt.Key.Key_Return:
-            self.checkbox.toggle()
-        else:
-            super().keyPressEvent(event)
+        """Override the default to toggle the current checkbox."""
+        index = self.currentIndex()
+        if (index.isValid() and index.column() == MainWindow.ROUND_TRIP_COL_INDEX and
+                event.key() in (Qt.Key.Key_Space, Qt.Key.Key_Return, Qt.Key.Key_Enter)):
+            if index.data(Qt.ItemDataRole.CheckStateRole) == Qt.CheckState.Checked:
+                state = Qt.CheckState.Unchecked
+            else:
+                state = Qt.CheckState.Checked
+            self.model().setData(index, state, Qt.ItemDataRole.CheckStateRole)
+            return
+        super().keyPressEvent(event)
 
-    def setText(self, text):
-        """Supply text-related methods so we don't have to handle checkboxes as a special case"""
-        if text == '1':
-            self.checkbox.setChecked(True)
+
+class CompletionModel(QAbstractListModel):
+    """
+    The names from a CompletionIndex that match the text that has been typed so far. Suggested
+    names come first, and are the only names before anything has been typed.
+    """
+
+    MAX_MATCHES = 50
+    MAX_SUGGESTIONS = 5
+
+    def __init__(self, completion_index, parent=None):
+        super().__init__(parent)
+        self.completion_index = completion_index
+        self.suggestions = {}
+        self.matches = []
+
+    def set_suggestions(self, names):
+        """The matches are looked up again the next time the text is set."""
+        self.suggestions = {name: i for i, name in enumerate(names)}
+
+    def set_completion_index(self, completion_index):
+        self.beginResetModel()
+        self.completion_index = completion_index
+        self.matches = []
+        self.endResetModel()
+
+    def set_text(self, text):
+        """Looks up the matches for text. The model is only reset if they changed."""
+        matches = self.completion_index.matches(text, self.MAX_MATCHES)
+        if not text.strip():
+            matches = list(self.suggestions) or matches
+        elif self.suggestions:
+            other = len(self.suggestions)
+            matches.sort(key=lambda name: self.suggestions.get(name, other))
+        if matches != self.matches:
+            self.beginResetModel()
+            self.matches = matches
+            self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        """Part of the QAbstractListModel interface."""
+        return 0 if parent.isValid() else len(self.matches)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        """Part of the QAbstractListModel interface."""
+        if index.isValid() and role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            return self.matches[index.row()]
+        return None
+
+
+class IndexedCompleter(QCompleter):
+    """
+    Shows the ranked matches from a CompletionIndex instead of doing QCompleter's own prefix
+    matching. The model is refilled whenever the completion prefix changes and all of its rows are
+    shown in the popup.
+    """
+
+    def __init__(self, completion_index, parent=None):
+        super().__init__(parent)
+        self.setModel(CompletionModel(completion_index, self))
+
+    def set_completion_index(self, completion_index):
+        self.model().set_completion_index(completion_index)
+
+    def set_suggestions(self, names):
+        self.model().set_suggestions(names)
+
+    def splitPath(self, path):
+        """Override the default so every row of the model matches."""
+        self.model().set_text(path)
+        return ['']
+
+
+class DistanceLoader(QThread):
+    """
+    Loads the table of 'official' distances without blocking the GUI thread and builds the index
+    for completing their names. The forms are also checked for fields (see use_form_widgets())
+    while it's at it.
+    """
+
+    loaded = pyqtSignal(object, object, str)
+    form_differences = pyqtSignal(list)
+
+    def __init__(self, pdf_path, cache_path, parent=None):
+        super().__init__(parent)
+        self.pdf_path = pdf_path
+        self.cache_path = cache_path
+
+    def run(self):
+        """
+        Emits a DistanceIndex, a CompletionIndex, and '', or None, None, and the reason if the
+        table couldn't be loaded.
+        """
+        error = ''
+        try:
+            data = DistanceIndex(load_distance_table(self.pdf_path, self.cache_path))
+            completion_index = CompletionIndex(data.keys())
+        except Exception as e:
+            data = None
+            completion_index = None
+            error = str(e)
+        try:
+            differences = use_form_widgets(os.path.join(BASE_DIR, ARTIFACTS_DIR, FORM_FILE),
+                                os.path.join(BASE_DIR, ARTIFACTS_DIR, ADDITIONAL_FORM_FILE),
+                                SettingsDialog.get_app_data_path(FORM_WIDGETS_CACHE_FILE))
+        except Exception as e:
+            # pdf_writer keeps using widget_data, which may not match the forms.
+            differences = [f"The forms' fields could not be read: {e}"]
+        if differences:
+            self.form_differences.emit(differences)
+        self.loaded.emit(data, completion_index, error)
+
+
+class PdfWriter(QThread):
+    """
+    Fills in the form without blocking the GUI thread. Emits progress as the rows are drawn and
+    then one of succeeded, failed, or cancelled.
+    """
+
+    progress = pyqtSignal(int, int)
+    succeeded = pyqtSignal(str, object)
+    failed = pyqtSignal(str, str)
+    cancelled = pyqtSignal(str)
+
+    def __init__(self, save_path, data, parent=None):
+        super().__init__(parent)
+        self.save_path = save_path
+        self.data = data
+        self._cancel = False
+
+    def cancel(self):
+        """Stops drawing at the next row. Nothing is saved."""
+        self._cancel = True
+
+    def _on_progress(self, done, total):
+        self.progress.emit(done, total)
+        return not self._cancel
+
+    def run(self):
+        """Emits the statistics from fill_form() or the reason that it failed."""
+        try:
+            stats = fill_form(os.path.join(BASE_DIR, ARTIFACTS_DIR, FORM_FILE),
+                                os.path.join(BASE_DIR, ARTIFACTS_DIR, ADDITIONAL_FORM_FILE),
+                                self.save_path, self.data, self._on_progress)
+        except FillCancelled:
+            self.cancelled.emit(self.save_path)
+        except Exception as e:
+            self.failed.emit(self.save_path, str(e))
         else:
-            self.checkbox.setChecked(False)
+            self.succeeded.emit(self.save_path, stats)
 
-    def text(self):
-        """Supply text-related methods so we don't have to handle checkboxes as a special case"""
-        if self.checkbox.isChecked():
-            return '1'
-        return '0'
 
-    def isReadOnly(self):
-        """Supply text-related methods so we don't have to handle checkboxes as a special case"""
-        return False
+class AutosaveWriter(QThread):
+    """
+    Writes snapshots of the table to the recovery file, or deletes it, without blocking the GUI
+    thread. Only the latest request is kept if others arrive while a write is in progress, and
+    run() handles it once that write is done.
+    """
 
-    def clear(self):
-        """Supply text-related methods so we don't have to handle checkboxes as a special case"""
-        self.checkbox.setChecked(False)
+    DISCARD = 'discard'
 
-    def _on_checkbox_toggled(self, state):
-        """Pass the checkbox's signal up to the table."""
-        self.toggled.emit(state)
+    def __init__(self, path, parent=None):
+        super().__init__(parent)
+        self.path = path
+        self._lock = threading.Lock()
+        self._pending = None
+        self._writing = False
+        self.finished.connect(self._start_pending)
+
+    def save(self, rows, doc_path):
+        self._request((rows, doc_path))
+
+    def discard(self):
+        """Drops any pending snapshot and deletes the recovery file."""
+        self._request(self.DISCARD)
+
+    def finish(self):
+        """Waits for the write in progress and handles anything still pending (before quitting)."""
+        self.wait()
+        self.run()
+
+    def _request(self, request):
+        with self._lock:
+            self._pending = request
+            if self._writing:
+                return
+            self._writing = True
+        self._start_pending()
+
+    def _start_pending(self):
+        # A request that arrives while the thread is returning from run() is started once the
+        # thread has finished.
+        if self._writing and not self.isRunning():
+            self.start()
+
+    def run(self):
+        """Handles the pending requests until there aren't any."""
+        while True:
+            with self._lock:
+                request = self._pending
+                self._pending = None
+                if request is None:
+                    self._writing = False
+                    return
+            try:
+                if request is self.DISCARD:
+                    os.remove(self.path)
+                else:
+                    cache_dir = os.path.dirname(self.path)
+                    if not os.path.exists(cache_dir):
+                        os.makedirs(cache_dir)
+                    save_recovery(self.path, *request)
+            except OSError:
+                pass
 
 
 class AboutDialog(QDialog):
@@ -242,7 +785,7 @@ class AboutDialog(QDialog):
 class SettingsDialog(QDialog):
     """Maintains a simple 'settings' data structure across multiple platforms."""
 
-    SETTINGS = ["Name", "Employee Number", "Building/Department", "Account Number"]
+    SETTINGS = app_data.USER_INFO_SETTINGS
 
     def __init__(self, settings):
         super().__init__()
@@ -274,12 +817,12 @@ class SettingsDialog(QDialog):
     @staticmethod
     def _get_settings_path():
         """Returns a reasonable place to put a settings file on different platforms."""
-        system_name = platform.system()
-        if system_name == 'Linux':
-            return os.path.expanduser(f'~/.{APP_NAME}/settings.json')
-        if system_name == 'Darwin':
-            return os.path.expanduser(f'~/Library/Application Support/{APP_NAME}/settings.json')
-        return os.path.join(os.getenv('LOCALAPPDATA'), APP_NAME, 'preferences.json')
+        return app_data.get_settings_path()
+
+    @staticmethod
+    def get_app_data_path(file_name):
+        """Returns a path for a file that the app manages itself next to the settings file."""
+        return app_data.get_app_data_path(file_name)
 
     @staticmethod
     def load_settings():
@@ -287,26 +830,127 @@ class SettingsDialog(QDialog):
         Reads a dict containing settings from the settings file. Initializes an empty dict
         if a file isn't found.
         """
-        pref_path = SettingsDialog._get_settings_path()
-        if os.path.exists(pref_path):
-            with open(pref_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        else:
-            return {s:'' for s in SettingsDialog.SETTINGS}
+        return app_data.load_user_info()
 
     @staticmethod
     def save_settings(settings):
         """Saves the specified settings dict to file."""
-        pref_path = SettingsDialog._get_settings_path()
-        pref_dir = os.path.dirname(pref_path)
-        if not os.path.exists(pref_dir):
-            os.makedirs(pref_dir)
-        with open(pref_path, 'w', encoding='utf-8') as f:
-            json.dump(settings, f)
+        app_data.save_user_info(settings)
+
+
+class ArchiveDialog(QDialog):
+    """
+    Imports documents into the trip archive and searches it. Accepting the dialog means that the
+    trips that match get_filters() should be loaded into the table.
+    """
+
+    # Only this many of the trips that are found are listed, however many there are.
+    MAX_SHOWN = 500
+
+    def __init__(self, archive, directory, parent=None):
+        super().__init__(parent)
+        self.archive = archive
+        self.directory = directory
+        self.setWindowTitle("Trip Archive")
+
+        # Start with the current month, which is usually what goes on a form.
+        today = QDate.currentDate()
+        self.start_edit = QDateEdit(QDate(today.year(), today.month(), 1))
+        self.end_edit = QDateEdit(QDate(today.year(), today.month(), today.daysInMonth()))
+        for edit in (self.start_edit, self.end_edit):
+            edit.setCalendarPopup(True)
+            edit.setDisplayFormat(MainWindow.DATE_STR_FORMAT)
+        self.location_edit = QLineEdit()
+        self.location_edit.setPlaceholderText("From or To")
+        self.purpose_edit = QLineEdit()
+        form = QFormLayout()
+        form.addRow(QLabel("From date:"), self.start_edit)
+        form.addRow(QLabel("To date:"), self.end_edit)
+        form.addRow(QLabel("Location:"), self.location_edit)
+        form.addRow(QLabel("Purpose:"), self.purpose_edit)
+
+        import_button = QPushButton("Import Documents...")
+        import_button.setAutoDefault(False)
+        import_button.clicked.connect(self._import)
+        search_button = QPushButton("Search")
+        search_button.setAutoDefault(False)
+        search_button.clicked.connect(self._search)
+        buttons = QHBoxLayout()
+        buttons.addWidget(import_button)
+        buttons.addStretch()
+        buttons.addWidget(search_button)
+
+        self.results = QTableWidget(0, len(MainWindow.COLS))
+        self.results.setHorizontalHeaderLabels([c[0] for c in MainWindow.COLS])
+        for i, (_, width) in enumerate(MainWindow.COLS):
+            self.results.setColumnWidth(i, width)
+        self.results.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.results.setMinimumWidth(sum(c[1] for c in MainWindow.COLS) + 40)
+        self.summary = QLabel()
+
+        button_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok |
+            QDialogButtonBox.StandardButton.Close)
+        self.load_button = button_box.button(QDialogButtonBox.StandardButton.Ok)
+        self.load_button.setText("Load into Table")
+        button_box.accepted.connect(self.accept)
+        button_box.rejected.connect(self.reject)
+
+        layout = QVBoxLayout()
+        layout.addLayout(form)
+        layout.addLayout(buttons)
+        layout.addWidget(self.results)
+        layout.addWidget(self.summary)
+        layout.addWidget(button_box)
+        self.setLayout(layout)
+        self._search()
+
+    def get_filters(self):
+        """Returns the keyword arguments for TripArchive.find_trips()."""
+        return {'start': self.start_edit.date().toPyDate(),
+                'end': self.end_edit.date().toPyDate(),
+                'location': self.location_edit.text().strip() or None,
+                'purpose': self.purpose_edit.text().strip() or None}
+
+    def _search(self):
+        filters = self.get_filters()
+        count = self.archive.count_trips(**filters)
+        rows = list(self.archive.find_trips(limit=self.MAX_SHOWN, **filters))
+        self.results.setRowCount(len(rows))
+        for i, row in enumerate(rows):
+            for j, value in enumerate(row):
+                if j == MainWindow.ROUND_TRIP_COL_INDEX:
+                    value = "Yes" if value == '1' else ''
+                self.results.setItem(i, j, QTableWidgetItem(value))
+        text = f"{count} trips in {len(self.archive.documents())} documents"
+        if count > len(rows):
+            text += f", the first {len(rows)} are shown"
+        self.summary.setText(text)
+        self.load_button.setEnabled(count > 0)
+
+    def _import(self):
+        paths, _ = QFileDialog.getOpenFileNames(self,
+            "Import Documents",
+            self.directory,
+            f"{APP_NAME} Files (*.{APP_EXT});;All Files (*)")
+        failed = []
+        for path in paths:
+            try:
+                # Documents that haven't changed since they were imported are skipped.
+                self.archive.import_document(path)
+            except:
+                failed.append(os.path.basename(path))
+        if failed:
+            QMessageBox.warning(self,
+                "Warning",
+                "These documents could not be imported:\n\n" + "\n".join(failed),
+                QMessageBox.StandardButton.Ok)
+        if paths:
+            self.directory = os.path.dirname(paths[0])
+            self._search()
 
 
 class MainWindow(QMainWindow):
-    """Presents a table of QDateEdit and QLineEdit widgets."""
+    """Presents a table of trips that are edited using QDateEdit and QLineEdit editors."""
 
     ROW_COUNT = 11
     COL_COUNT = 7
@@ -327,16 +971,29 @@ class MainWindow(QMainWindow):
 
     ROW_COL_WIDTH = 25
 
+    # Don't flash the progress dialog for short PDFs.
+    PDF_PROGRESS_DELAY_MS = 500
+
+    # Unsaved changes are written to the recovery file once the table has been left alone for
+    # AUTOSAVE_DELAY_MS, or at least every AUTOSAVE_MAX_DELAY_MS while it's being edited.
+    AUTOSAVE_DELAY_MS = 2000
+    AUTOSAVE_MAX_DELAY_MS = 30000
+
+    # The rest of a long list of the forms' differences is only counted.
+    MAX_FORM_DIFFERENCES = 10
+
     EMPTY_ROW_COLOR = 'gray'
-    OLD_DATE_STR_FORMAT = 'MM/dd/yy'
     DATE_STR_FORMAT = 'MM/dd/yyyy'
 
     def __init__(self, data, settings, initial_file=None):
         super().__init__()
 
+        # The distances may still be loading, see set_distances().
         self.distances = data
         self.settings = settings
         self.doc_path = None
+        # What was last saved to (or loaded from) doc_path, see save_document().
+        self.doc_journal = None
 
         self.setWindowTitle(self._get_window_title())
         self.setAcceptDrops(True)
@@ -344,36 +1001,77 @@ class MainWindow(QMainWindow):
         central_widget = QWidget(self)
         self.setCentralWidget(central_widget)
 
-        self.table_widget = QTableWidget(central_widget)
-        self.table_widget.setColumnCount(self.COL_COUNT)
-        self.table_widget.setHorizontalHeaderLabels([c[0] for c in self.COLS])
+        # The purposes and routes of the documents that were opened and saved, best first.
+        self.trip_history = TripHistory.load(SettingsDialog.get_app_data_path(HISTORY_FILE),
+                                                self.PURPOSE)
 
-        for i, c in enumerate(self.COLS):
-            self.table_widget.setColumnWidth(i, c[1])
+        self._create_completers_and_validators()
 
-        self.table_widget.verticalHeader().setFixedWidth(self.ROW_COL_WIDTH)
+        # Rows whose From, To, Purpose, Parking or Miles changed since the last _update_table().
+        self.changed_rows = set()
+
+        # Opened the first time it's needed, see _get_trip_archive().
+        self.trip_archive = None
+
+        # The PDF that is being created, see _create_pdf().
+        self.pdf_writer = None
+        self.pdf_progress = None
+
+        # See _schedule_autosave().
+        self.autosave_writer = AutosaveWriter(SettingsDialog.get_app_data_path(RECOVERY_FILE), self)
+        self.autosave_timer = QTimer(self)
+        self.autosave_timer.setSingleShot(True)
+        self.autosave_timer.setInterval(self.AUTOSAVE_DELAY_MS)
+        self.autosave_timer.timeout.connect(self._autosave)
+        self.autosave_since = 0
+
+        self.table_model = TripTableModel([c[0] for c in self.COLS], self.ROW_COUNT, self)
+        self.table_model.dateChanged.connect(self._on_date_changed)
+        self.table_model.dataChanged.connect(self._on_data_changed)
+        self.table_model.rowsInserted.connect(self._schedule_autosave)
+        self.table_model.rowsRemoved.connect(self._schedule_autosave)
+
+        self.table_delegate = TripItemDelegate(self)
+        self.table_delegate.advance.connect(self._return_pressed)
+
+        self.table_view = TripTableView(central_widget)
+        self.table_view.setModel(self.table_model)
+        self.table_view.setItemDelegate(self.table_delegate)
+        self.table_view.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        # Open an editor as soon as a cell is selected, like when every cell was a widget.
+        self.table_view.setEditTriggers(QAbstractItemView.EditTrigger.CurrentChanged |
+                                        QAbstractItemView.EditTrigger.DoubleClicked |
+                                        QAbstractItemView.EditTrigger.SelectedClicked |
+                                        QAbstractItemView.EditTrigger.AnyKeyPressed)
 
-        self._create_completers_and_validators()
+        for i, c in enumerate(self.COLS):
+            self.table_view.setColumnWidth(i, c[1])
+
+        self.table_view.verticalHeader().setFixedWidth(self.ROW_COL_WIDTH)
+        self.table_view.verticalHeader().setDefaultAlignment(Qt.AlignmentFlag.AlignCenter)
 
         for row in range(self.ROW_COUNT):
-            self._add_table_row(row)
+            self._set_custom_font(row, self.DATE_COL_INDEX, self.EMPTY_ROW_COLOR)
 
-        self.table_widget.itemSelectionChanged.connect(self._cell_selection_changed)
+        self.table_view.selectionModel().currentChanged.connect(self._cell_selection_changed)
 
         self.row_button = QPushButton("Add row")
         self.row_button.setShortcut("Ctrl+A")
         self.row_button.clicked.connect(self._grow_table)
 
-        pdf_button = QPushButton("Create PDF")
-        pdf_button.setShortcut("Ctrl+P")
-        pdf_button.clicked.connect(self._create_pdf)
+        self.pdf_button = QPushButton("Create PDF")
+        self.pdf_button.setShortcut("Ctrl+P")
+        self.pdf_button.clicked.connect(self._create_pdf)
+        # Until set_distances() is called the miles would be the ones typed in the document, and
+        # PyMuPDF can't be used by the PdfWriter while the DistanceLoader is using it.
+        self.pdf_button.setEnabled(self.distances is not None)
 
         layout = QVBoxLayout(central_widget)
-        layout.addWidget(self.table_widget)
+        layout.addWidget(self.table_view)
         bottom_layout = QHBoxLayout()
         bottom_layout.addWidget(self.row_button)
         bottom_layout.addStretch(1)  # Add stretchable space to push button to the right
-        bottom_layout.addWidget(pdf_button)
+        bottom_layout.addWidget(self.pdf_button)
         layout.addLayout(bottom_layout)
         central_widget.setLayout(layout)
 
@@ -382,20 +1080,20 @@ class MainWindow(QMainWindow):
         self._add_menubar()
         self._set_min_and_max_window_size()
 
-        self.last_save = self._read_table()
+        self.table_model.mark_saved()
         if initial_file:
             self.open_file(initial_file)
 
     def _set_min_and_max_window_size(self):
-        style = self.table_widget.style()
+        style = self.table_view.style()
         option = QStyleOption()
-        option.initFrom(self.table_widget)
+        option.initFrom(self.table_view)
 
         extra_h_space = self.ROW_COL_WIDTH
-        v = style.pixelMetric(QStyle.PixelMetric.PM_DefaultFrameWidth, option, self.table_widget)
+        v = style.pixelMetric(QStyle.PixelMetric.PM_DefaultFrameWidth, option, self.table_view)
         extra_h_space += 2 * v
 
-        v = style.pixelMetric(QStyle.PixelMetric.PM_LayoutLeftMargin, option, self.table_widget)
+        v = style.pixelMetric(QStyle.PixelMetric.PM_LayoutLeftMargin, option, self.table_view)
         extra_h_space += 2 * v
 
         # Add extra space so the vertical scrollbar doesn't cause a horizontal scrollbar on Big Sur.
@@ -404,18 +1102,19 @@ class MainWindow(QMainWindow):
 
         preferred_width = sum(x[1] for x in self.COLS) + extra_h_space
         self.setMinimumSize(preferred_width,
-                self.table_widget.rowHeight(0) * (self.ROW_COUNT + 3) + 3)
+                self.table_view.rowHeight(0) * (self.ROW_COUNT + 3) + 3)
         self.setMaximumWidth(preferred_width)
 
     def _create_completers_and_validators(self):
-        school_names = self.distances.keys()
-        self.school_completer = QCompleter(school_names)
-        self.school_completer.setCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
-        self.school_completer.activated.connect(self._enter_pressed)
+        school_names = list(self.distances.keys()) if self.distances else []
+        self.school_completer = IndexedCompleter(CompletionIndex(school_names), self)
+        # Queued so the editor receives the completion before it's committed.
+        self.school_completer.activated.connect(self._enter_pressed,
+                                                    Qt.ConnectionType.QueuedConnection)
 
-        self.purpose_completer = QCompleter(self.PURPOSE)
-        self.purpose_completer.setCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
-        self.purpose_completer.activated.connect(self._enter_pressed)
+        self.purpose_completer = IndexedCompleter(self.trip_history.purposes, self)
+        self.purpose_completer.activated.connect(self._enter_pressed,
+                                                    Qt.ConnectionType.QueuedConnection)
 
         self.money_validator = QDoubleValidator()
         self.money_validator.setBottom(0.0)
@@ -425,6 +1124,38 @@ class MainWindow(QMainWindow):
         self.mileage_validator.setBottom(0.0)
         self.mileage_validator.setDecimals(1)
 
+    def set_distances(self, data, completion_index=None, error=''):
+        """
+        Called when the table of 'official' distances has been loaded. Any rows that were entered
+        or opened in the meantime get their miles looked up now. The index for completing the
+        names is built here unless it's specified. PDFs can be created from now on even if the
+        table couldn't be loaded (data is None), and error is shown as the reason.
+        """
+        self.pdf_button.setEnabled(self.pdf_writer is None)
+        if data is None:
+            QMessageBox.warning(self,
+                "Warning",
+                "The table of official distances could not be loaded." +
+                    (f"\n\n{error}" if error else ""),
+                QMessageBox.StandardButton.Ok)
+            return
+        self.distances = data
+        if completion_index is None:
+            completion_index = CompletionIndex(data.keys())
+        self.school_completer.set_completion_index(completion_index)
+        self._update_table(all_rows=True)
+
+    def show_form_differences(self, differences):
+        """Warns that the forms' fields aren't the ones this version was made for."""
+        shown = differences[:self.MAX_FORM_DIFFERENCES]
+        if len(differences) > len(shown):
+            shown.append(f"...and {len(differences) - len(shown)} more.")
+        QMessageBox.warning(self,
+            "Warning",
+            "The mileage forms have changed. Please check the PDFs carefully.\n\n" +
+                "\n".join(shown),
+            QMessageBox.StandardButton.Ok)
+
     def _add_menubar(self):
         new_action = QAction("&New File", self)
         new_action.setShortcut("Ctrl+N")
@@ -442,6 +1173,10 @@ class MainWindow(QMainWindow):
         save_as_action.setShortcut("Ctrl+Shift+S")
         save_as_action.triggered.connect(self._save_as)
 
+        archive_action = QAction("Trip &Archive", self)
+        archive_action.setShortcut("Ctrl+Shift+A")
+        archive_action.triggered.connect(self._show_archive)
+
         exit_action = QAction("&Exit", self)
         exit_action.setShortcut("Ctrl+Q")
         exit_action.triggered.connect(self.close)
@@ -464,40 +1199,16 @@ class MainWindow(QMainWindow):
         file_menu.addAction(self.save_action)
         file_menu.addAction(save_as_action)
         file_menu.addSeparator()
+        file_menu.addAction(archive_action)
+        file_menu.addSeparator()
         file_menu.addAction(exit_action)
         pref_menu.addAction(settings_action)
         help_menu.addAction(about_action)
 
     def _add_table_row(self, row):
-        self.table_widget.insertRow(row)
-        for col in range(self.COL_COUNT):
-            if col == self.DATE_COL_INDEX:
-                date_edit = QDateEdit()
-                date_edit.setCalendarPopup(True)
-                date_edit.setStyleSheet(f"color: {self.EMPTY_ROW_COLOR}")
-                date_edit.setDate(QDate.currentDate())
-                # NOTE: Don't connect this until after setDate is called.
-                date_edit.dateChanged.connect(self._on_date_changed)
-                self.table_widget.setCellWidget(row, col, date_edit)
-            elif col == self.ROUND_TRIP_COL_INDEX:
-                checkbox = CustomCheckBox(row)
-                checkbox.toggled.connect(self._on_checkbox_toggled)
-                self.table_widget.setCellWidget(row, col, checkbox)
-            else:
-                line_edit = CustomLineEdit(row)
-                if col in (self.FROM_COL_INDEX, self.TO_COL_INDEX):
-                    line_edit.setCompleter(self.school_completer)
-                elif col == self.PURPOSE_COL_INDEX:
-                    line_edit.setCompleter(self.purpose_completer)
-                else:
-                    line_edit.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                    if col == self.PARKING_COL_INDEX:
-                        line_edit.setValidator(self.money_validator)
-                    else:
-                        line_edit.setValidator(self.mileage_validator)
-                    line_edit.returnPressed.connect(self._return_pressed)
-
-                self.table_widget.setCellWidget(row, col, line_edit)
+        self.table_model.insertRows(row, 1)
+        self._set_custom_font(row, self.DATE_COL_INDEX, self.EMPTY_ROW_COLOR)
+        self.changed_rows.add(row)
 
     def dragEnterEvent(self, event: QDragEnterEvent):
         """
@@ -531,31 +1242,108 @@ class MainWindow(QMainWindow):
 
     def closeEvent(self, event):
         """Override the default close function to prompt the user in case of unsaved changes."""
-        data = self._read_table()
-        if data != self.last_save:
+        if self.table_model.is_modified():
             reply = QMessageBox.question(self,
                 "Confirm Your Action",
                 "Do you want to save your data before exiting?",
                 QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
                 QMessageBox.StandardButton.Yes)
             if reply == QMessageBox.StandardButton.Yes:
-                if not self._save_file(data):
+                if not self._save_file():
                     event.ignore()
                     return
+        if self.pdf_writer:
+            # Let the PDF be finished rather than leave a partial file behind.
+            self.pdf_writer.wait()
+        # Quitting normally means the changes were either saved or deliberately discarded.
+        self._discard_autosave()
+        self.autosave_writer.finish()
         event.accept()
 
-    def _on_date_changed(self, date):
+    def _on_date_changed(self, row, date):
         """
         Most of the time the user updates the table in chronological order. To make this easier
         we propogate date changes down from the current line so (hopefully) the desired date will
         be closer when the user needs to select the next one. Lines with existing data are skipped.
+        All of the lines are updated at once so this isn't called again for each of them.
         """
-        coords = self._get_row_and_col()
-        if coords:
-            row, _ = coords
-            for i in range(row + 1, self.table_widget.rowCount()):
-                if self._row_is_empty(i):
-                    self.table_widget.cellWidget(i, self.DATE_COL_INDEX).setDate(date)
+        rows = [i for i in range(row + 1, self.table_model.rowCount()) if self._row_is_empty(i)]
+        self.table_model.set_dates(rows, date)
+
+    def _on_data_changed(self, top_left, bottom_right, roles=()):
+        """
+        Remember which rows need their miles and styles updated. Ensure that the File->Save menu
+        is available after toggling a checkbox. Changing only the styles or whether Miles can be
+        edited doesn't change the data.
+        """
+        if roles and all(role in TripTableModel.STYLE_ROLES or role == TripTableModel.READ_ONLY_ROLE
+                            for role in roles):
+            return
+        if (top_left.column() <= self.MILES_COL_INDEX and
+                bottom_right.column() >= self.FROM_COL_INDEX):
+            self.changed_rows.update(range(top_left.row(), bottom_right.row() + 1))
+        if top_left.column() <= self.ROUND_TRIP_COL_INDEX <= bottom_right.column():
+            self._on_checkbox_toggled(None)
+        self._schedule_autosave()
+
+    def _schedule_autosave(self, *_):
+        """
+        Restarts the autosave timer after each change so nothing is written while typing, unless
+        the changes have been going on for AUTOSAVE_MAX_DELAY_MS.
+        """
+        now = time.monotonic()
+        if not self.autosave_timer.isActive():
+            self.autosave_since = now
+        elif (now - self.autosave_since) * 1000 >= self.AUTOSAVE_MAX_DELAY_MS:
+            return
+        self.autosave_timer.start()
+
+    def _autosave(self):
+        """Writes the table to the recovery file, or deletes it if there's nothing to recover."""
+        if self.table_model.is_modified():
+            self.autosave_writer.save(self._read_table(), self.doc_path)
+        else:
+            self.autosave_writer.discard()
+
+    def _discard_autosave(self):
+        self.autosave_timer.stop()
+        self.autosave_writer.discard()
+
+    def restore_autosave(self):
+        """Offers to restore the unsaved changes from a session that didn't quit normally."""
+        recovery = load_recovery(self.autosave_writer.path)
+        if not recovery:
+            return
+        rows, doc_path, time_str = recovery
+        name = os.path.basename(doc_path) if doc_path else "an untitled document"
+        reply = QMessageBox.question(self,
+            "Restore Unsaved Changes",
+            f"{APP_NAME} didn't quit normally. Do you want to restore the unsaved changes to " +
+            f"{name} from {time_str}?",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+            QMessageBox.StandardButton.Yes)
+        if reply != QMessageBox.StandardButton.Yes:
+            self._discard_autosave()
+            return
+        try:
+            saved_rows, journal = [], None
+            if doc_path and os.path.exists(doc_path):
+                saved_rows, journal = load_document(doc_path)
+            # Start from the saved document so only the rows that really differ are unsaved.
+            self._write_table(update_school_names(saved_rows))
+            self.table_model.mark_saved()
+            self._write_table(update_school_names(rows))
+        except:
+            QMessageBox.critical(self,
+                "Error",
+                "The unsaved changes could not be restored.",
+                QMessageBox.StandardButton.Ok)
+            self._discard_autosave()
+            return
+        self.doc_path = doc_path
+        self.doc_journal = journal
+        self._update_table()
+        self._update_save_item_and_title(True)
 
     def _on_checkbox_toggled(self, _):
         """Ensure that the File->Save menu is available after toggling a checkbox."""
@@ -595,7 +1383,7 @@ class MainWindow(QMainWindow):
                 f"At least one line doesn't have a value for the '{err_col_str}' column.",
                 QMessageBox.StandardButton.Ok,
                 QMessageBox.StandardButton.Ok)
-            self.table_widget.setCurrentCell(err_row, err_col)
+            self.table_view.setCurrentIndex(self.table_model.index(err_row, err_col))
             return
 
         file_dialog = QFileDialog(self)
@@ -609,34 +1397,65 @@ class MainWindow(QMainWindow):
             if not ext:
                 file_path = file_path + ".pdf"
 
-            try:
-                form_path = os.path.join(BASE_DIR, ARTIFACTS_DIR, FORM_FILE)
-                add_form_path = os.path.join(BASE_DIR, ARTIFACTS_DIR, ADDITIONAL_FORM_FILE)
-                fill_form(form_path, add_form_path, file_path, data)
-            except:
-                QMessageBox.critical(self,
-                    "Error",
-                    "The PDF could not be saved.",
-                    QMessageBox.StandardButton.Ok)
-            else:
-                QMessageBox.information(self,
-                    "PDF Created", "Remember to review the PDF and sign it before submitting!",
-                    QMessageBox.StandardButton.Ok)
+            # The table keeps working while the PDF is created from this copy of its data.
+            self.pdf_progress = QProgressDialog("Creating the PDF...", "Cancel", 0, 0, self)
+            self.pdf_progress.setWindowTitle("Create PDF")
+            self.pdf_progress.setMinimumDuration(self.PDF_PROGRESS_DELAY_MS)
+            self.pdf_progress.setAutoReset(False)
+            self.pdf_writer = PdfWriter(file_path, data, self)
+            self.pdf_writer.progress.connect(self._on_pdf_progress)
+            self.pdf_writer.succeeded.connect(self._on_pdf_succeeded)
+            self.pdf_writer.failed.connect(self._on_pdf_failed)
+            self.pdf_writer.cancelled.connect(self._on_pdf_finished)
+            self.pdf_writer.finished.connect(self.pdf_writer.deleteLater)
+            self.pdf_progress.canceled.connect(self.pdf_writer.cancel)
+            self.pdf_button.setEnabled(False)
+            self.pdf_writer.start()
+
+    def _on_pdf_progress(self, done, total):
+        if self.pdf_progress:
+            self.pdf_progress.setMaximum(total)
+            self.pdf_progress.setValue(done)
+
+    def _on_pdf_finished(self, _=None):
+        """Called when the PdfWriter is done, whether or not it succeeded."""
+        self.pdf_writer = None
+        if self.pdf_progress:
+            self.pdf_progress.close()
+            self.pdf_progress.deleteLater()
+            self.pdf_progress = None
+        self.pdf_button.setEnabled(True)
+
+    def _on_pdf_succeeded(self, _, stats):
+        self._on_pdf_finished()
+        message = "Remember to review the PDF and sign it before submitting!"
+        if stats['form_sets'] > 1:
+            message = format_grand_total(stats['form_sets'], stats['parking_total'],
+                                            stats['miles_total']) + f".\n\n{message}"
+        QMessageBox.information(self,
+            "PDF Created", message,
+            QMessageBox.StandardButton.Ok)
+
+    def _on_pdf_failed(self, _, message):
+        self._on_pdf_finished()
+        QMessageBox.critical(self,
+            "Error",
+            f"The PDF could not be saved.\n\n{message}",
+            QMessageBox.StandardButton.Ok)
 
     def _read_table(self, strip_empty_rows=False):
         # Read the table starting from the bottom and skip empty rows until content is encountered.
         # Then only skip empty rows if strip_empty_rows.
         data = []
         found_non_empty_row = False
-        for i in range(self.table_widget.rowCount() - 1, -1, -1):
+        for i in range(self.table_model.rowCount() - 1, -1, -1):
             row = []
             for j in range(1, self.COL_COUNT):
-                w = self.table_widget.cellWidget(i, j)
-                row.append(w.text())
+                row.append(self.table_model.text(i, j))
             # Don't preserve dates on lines that are otherwise empty.
             if row != ['', '', '', '', '', '0']:
                 found_non_empty_row = True
-                d = self.table_widget.cellWidget(i, self.DATE_COL_INDEX).date()
+                d = self.table_model.date(i)
                 row.insert(0, d.toString(self.DATE_STR_FORMAT))
                 data.append(row)
             elif not strip_empty_rows and found_non_empty_row:
@@ -646,20 +1465,29 @@ class MainWindow(QMainWindow):
         return data
 
     def _write_table(self, data):
-        for i in range(self.table_widget.rowCount(), len(data)):
-            self._add_table_row(i)
-        for i, row in enumerate(data):
-            for j in range(self.FROM_COL_INDEX, len(row)):
-                self.table_widget.cellWidget(i, j).setText(row[j])
-            date_widget = self.table_widget.cellWidget(i, self.DATE_COL_INDEX)
-            if row[self.DATE_COL_INDEX]:
-                date = QDate.fromString(row[self.DATE_COL_INDEX], self.DATE_STR_FORMAT)
-                if not date.isValid():
-                    date = QDate.fromString(row[self.DATE_COL_INDEX], self.OLD_DATE_STR_FORMAT)
-                    date = date.addYears(100)
-                date_widget.setDate(date)
+        """
+        Replaces the contents of the table with the rows of a document all at once. Like when
+        the dates are typed in, the empty rows that follow the last row get its date.
+        """
+        dates = {}
+        date = QDate.currentDate()
+        rows = []
+        for row in data:
+            text = row[self.DATE_COL_INDEX]
+            if text:
+                date = dates.get(text)
+                if date is None:
+                    day = parse_date(text)
+                    date = dates[text] = QDate(day.year, day.month, day.day)
             else:
-                date_widget.setDate(QDate.currentDate())
+                date = QDate.currentDate()
+            values = list(row[self.FROM_COL_INDEX:self.COL_COUNT])
+            values += ['', '', '', '', '', '0'][len(values):]
+            rows.append([date] + values)
+        for _ in range(len(rows), self.ROW_COUNT):
+            rows.append([date, '', '', '', '', '', '0'])
+        self.table_view.setCurrentIndex(self.table_model.index(0, 0))
+        self.table_model.set_rows(rows)
 
     def _get_default_file_dialog_path(self):
         """Get the path to the user's Desktop unless a file has been recently opened or saved"""
@@ -667,13 +1495,12 @@ class MainWindow(QMainWindow):
             return os.path.dirname(self.doc_path)
         return os.path.expanduser('~/Desktop')
 
-    def _update_save_item_and_title(self, read_table=False):
-        if not read_table:
+    def _update_save_item_and_title(self, check_modified=False):
+        if not check_modified:
             self.save_action.setEnabled(False)
             self.setWindowTitle(self._get_window_title(False))
             return
-        data = self._read_table()
-        if data != self.last_save:
+        if self.table_model.is_modified():
             if not self.save_action.isEnabled():
                 self.save_action.setEnabled(True)
                 self.setWindowTitle(self._get_window_title(True))
@@ -686,12 +1513,15 @@ class MainWindow(QMainWindow):
         if not data:
             data = self._read_table()
         try:
-            with open(file_path, 'w', encoding='utf-8') as file:
-                json.dump(data, file, indent=4)
-                self.last_save = data
-                self.doc_path = file_path
-                self._update_save_item_and_title()
-                return True
+            # Only the rows that changed are appended to the document, see save_document().
+            self.doc_journal = save_document(file_path, data, self.doc_journal)
+            self.table_model.mark_saved()
+            self.doc_path = file_path
+            self._update_save_item_and_title()
+            self._discard_autosave()
+            self._update_trip_archive(file_path)
+            self._update_trip_history(file_path, data)
+            return True
         except:
             QMessageBox.critical(self,
                 "Error",
@@ -717,27 +1547,19 @@ class MainWindow(QMainWindow):
         return self._save_as(data)
 
     def _clear_table(self):
-        self.table_widget.setCurrentCell(0, 0)
-        self.table_widget.setRowCount(self.ROW_COUNT)
-        today = QDate.currentDate()
-        for i in range(0, self.table_widget.rowCount()):
-            self.table_widget.cellWidget(i, self.DATE_COL_INDEX).setDate(today)
-            for j in range(1, self.COL_COUNT):
-                self.table_widget.cellWidget(i, j).clear()
-        self.table_widget.setCurrentCell(0, 0)
+        self._write_table([])
 
     def open_file(self, file_path=None):
         """Opens the specified file path"""
         if not file_path:
-            data = self._read_table()
-            if data != self.last_save:
+            if self.table_model.is_modified():
                 reply = QMessageBox.question( self,
                     "Confirm Your Action",
                     "Do you want to save your data before continuing?",
                     QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
                     QMessageBox.StandardButton.Yes)
                 if reply == QMessageBox.StandardButton.Yes:
-                    if not self._save_file(data):
+                    if not self._save_file():
                         return
             file_dialog = QFileDialog(self)
             file_dialog.setDirectory(self._get_default_file_dialog_path())
@@ -749,20 +1571,14 @@ class MainWindow(QMainWindow):
         if file_path:
             try:
                 if os.path.exists(file_path):
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                        for row in data:
-                            name = row[self.FROM_COL_INDEX]
-                            if name in UPDATED_SCHOOL_NAMES:
-                                row[self.FROM_COL_INDEX] = UPDATED_SCHOOL_NAMES[name]
-                            name = row[self.TO_COL_INDEX]
-                            if name in UPDATED_SCHOOL_NAMES:
-                                row[self.TO_COL_INDEX] = UPDATED_SCHOOL_NAMES[name]
-                        self._clear_table()
-                        self._write_table(data)
-                        self.last_save = self._read_table()
-                        self.doc_path = file_path
-                        self._update_save_item_and_title()
+                    data, journal = load_document(file_path)
+                    data = update_school_names(data)
+                    self._write_table(data)
+                    self.table_model.mark_saved()
+                    self.doc_path = file_path
+                    self.doc_journal = journal
+                    self._update_save_item_and_title()
+                    self._update_trip_history(file_path, data)
             except:
                 QMessageBox.critical(self,
                     "Error",
@@ -772,28 +1588,88 @@ class MainWindow(QMainWindow):
 
     def _new_file(self):
         """Could have also been called 'Clear Table'."""
-        data = self._read_table()
-        if data != self.last_save:
+        if self.table_model.is_modified():
             reply = QMessageBox.question(self,
                 "Confirm Your Action",
                 "Do you want to save your data before starting a new file?",
                 QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
                 QMessageBox.StandardButton.Yes)
             if reply == QMessageBox.StandardButton.Yes:
-                if not self._save_file(data):
+                if not self._save_file():
                     return
         self._clear_table()
-        self.last_save = self._read_table()
+        self.table_model.mark_saved()
         self.doc_path = None
+        self.doc_journal = None
         self._update_save_item_and_title()
+        self._update_table(False)
 
     def _grow_table(self):
-        count = self.table_widget.rowCount()
-        if count < MAX_ROWS:
-            self._add_table_row(count)
-            self._update_table(False)
-        if count == (MAX_ROWS - 1):
-            self.row_button.setEnabled(False)
+        """There's no limit since long tables are continued on additional copies of the forms."""
+        self._add_table_row(self.table_model.rowCount())
+        self._update_table(False)
+
+    def _get_trip_archive(self):
+        """Opens the archive the first time it's needed since importing sqlite3 takes a while."""
+        if self.trip_archive is None:
+            from trip_archive import TripArchive
+            self.trip_archive = TripArchive(SettingsDialog.get_app_data_path(ARCHIVE_FILE))
+        return self.trip_archive
+
+    def _update_trip_archive(self, file_path):
+        """Keeps the trips of a document that was imported into the archive up to date."""
+        try:
+            if (self.trip_archive is None and
+                    not os.path.exists(SettingsDialog.get_app_data_path(ARCHIVE_FILE))):
+                return
+            archive = self._get_trip_archive()
+            if archive.has_document(file_path):
+                archive.import_document(file_path)
+        except:
+            # The document itself was saved, importing it again will bring the archive up to date.
+            pass
+
+    def _update_trip_history(self, file_path, data):
+        """Learns the purposes and routes of a document that was just opened or saved."""
+        try:
+            st = os.stat(file_path)
+            if self.trip_history.update_document(file_path, data, (st.st_size, st.st_mtime_ns)):
+                self.trip_history.save(SettingsDialog.get_app_data_path(HISTORY_FILE))
+        except:
+            # The suggestions are only a convenience, they'll catch up the next time.
+            pass
+
+    def _show_archive(self):
+        """Searches the archive and loads the trips that were found as a new document."""
+        try:
+            archive = self._get_trip_archive()
+            dialog = ArchiveDialog(archive, self._get_default_file_dialog_path(), self)
+        except:
+            QMessageBox.critical(self,
+                "Error",
+                "The trip archive could not be opened.",
+                QMessageBox.StandardButton.Ok)
+            return
+        if dialog.exec() != QDialog.DialogCode.Accepted:
+            return
+        if self.table_model.is_modified():
+            reply = QMessageBox.question(self,
+                "Confirm Your Action",
+                "Do you want to save your data before loading the trips?",
+                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+                QMessageBox.StandardButton.Yes)
+            if reply == QMessageBox.StandardButton.Yes:
+                if not self._save_file():
+                    return
+        rows = list(archive.find_trips(**dialog.get_filters()))
+        # The trips aren't saved anywhere yet, so they're all unsaved changes to a new document.
+        self._clear_table()
+        self.table_model.mark_saved()
+        self._write_table(rows)
+        self.doc_path = None
+        self.doc_journal = None
+        self._update_save_item_and_title()
+        self._update_table()
 
     def _show_settings(self):
         dialog = SettingsDialog(self.settings)
@@ -808,10 +1684,9 @@ class MainWindow(QMainWindow):
         about_dialog.exec()
 
     def _get_row_and_col(self):
-        selected_ranges = self.table_widget.selectedRanges()
-        if selected_ranges:
-            selected_range = selected_ranges[0]
-            return (selected_range.topRow(), selected_range.leftColumn())
+        index = self.table_view.currentIndex()
+        if index.isValid():
+            return (index.row(), index.column())
         return None
 
     def _select_next_cell(self):
@@ -824,24 +1699,19 @@ class MainWindow(QMainWindow):
                     col = 0
                 else:
                     col += 1
-                cell = self.table_widget.cellWidget(row, col)
-                if cell:
-                    if not cell.isReadOnly():
+                if row < self.table_model.rowCount():
+                    if not self.table_model.is_read_only(row, col):
                         break
                 else:
                     row = 0
                     col = 0
                     break
-            self.table_widget.setCurrentCell(row, col)
+            # Take the focus from the old editor first or hiding it would move to yet another cell.
+            self.table_view.setFocus()
+            self.table_view.setCurrentIndex(self.table_model.index(row, col))
 
     def _set_custom_font(self, row, col, color=None, bold=False):
-        item = self.table_widget.cellWidget(row, col)
-        sheet = ""
-        if color:
-            sheet += f"color: {color}"
-        if bold:
-            sheet += "font-weight: bold;"
-        item.setStyleSheet(sheet)
+        self.table_model.set_style(row, col, color, bold)
 
     def _clear_custom_font(self, row, col):
         self._set_custom_font(row, col)
@@ -852,8 +1722,7 @@ class MainWindow(QMainWindow):
             row, col = coords
             self._update_table()
             self._clear_custom_font(row, self.DATE_COL_INDEX)
-            widget = self.table_widget.cellWidget(row, col)
-            if widget.isReadOnly():
+            if self.table_model.is_read_only(row, col):
                 self._select_next_cell()
 
     def _enter_pressed(self, _):
@@ -863,68 +1732,87 @@ class MainWindow(QMainWindow):
         self._select_next_cell()
 
     def _row_is_empty(self, row):
-        data = ''.join(self.table_widget.cellWidget(row, j).text()
+        data = ''.join(self.table_model.text(row, j)
                                 for j in range(self.FROM_COL_INDEX, (self.COL_COUNT - 1)))
         return data == ''
 
     def _find_distance(self, origin, dest):
         """This method may be called multipled times during the entry of a location."""
-        dist = self.distances.get(origin, None)
-        if dist:
-            dist = dist.get(dest, None)
-            if dist:
-                return dist
-        dist = self.distances.get(dest, None)
-        if dist:
-            dist = dist.get(origin, None)
-            if dist:
-                return dist
-        return None
+        if not self.distances:
+            return None
+        return self.distances.find(origin, dest)
 
-    def _update_table(self, update_save_and_title=True):
-        """Iterates through the entire table. For each line:
+    def _update_table(self, update_save_and_title=True, all_rows=False):
+        """Iterates through the lines that changed since the last call (or the entire table if
+        all_rows is True). For each line:
          -If the line is blank set the 'Date' text to gray, else default color
          -If the From and To locations are valid then set the 'Miles' value (with default color)
          -If there is an error with the From or To locations then highlite 'Miles' to show error
         """
-        for i in range(0, self.table_widget.rowCount()):
-            if self._row_is_empty(i):
-                self._set_custom_font(i, self.DATE_COL_INDEX, self.EMPTY_ROW_COLOR)
-            else:
-                self._clear_custom_font(i, self.DATE_COL_INDEX)
-                origin = self.table_widget.cellWidget(i, self.FROM_COL_INDEX).text()
-                dest = self.table_widget.cellWidget(i, self.TO_COL_INDEX).text()
-                miles = self.table_widget.cellWidget(i, self.MILES_COL_INDEX)
-                if origin and dest:
-                    if origin.upper() == dest.upper():
-                        miles.setText('0')
-                        self._set_custom_font(i, self.MILES_COL_INDEX, None, True)
-                        miles.setReadOnly(True)
-                    else:
-                        dist = self._find_distance(origin, dest)
-                        if dist:
-                            miles.setText(str(dist))
-                            self._set_custom_font(i, self.MILES_COL_INDEX, None, True)
-                            miles.setReadOnly(True)
-                        else:
-                            if miles.isReadOnly():
-                                miles.clear()
-                            self._clear_custom_font(i, self.MILES_COL_INDEX)
-                            miles.setReadOnly(False)
-                else:
-                    miles.setReadOnly(False)
-                    self._clear_custom_font(i, self.MILES_COL_INDEX)
+        model = self.table_model
+        if all_rows:
+            rows = range(0, model.rowCount())
+        else:
+            rows = sorted(i for i in self.changed_rows if i < model.rowCount())
+        for i in rows:
+            self._update_row(i)
+        # Updating the Miles column marks the rows as changed again.
+        self.changed_rows.clear()
         if update_save_and_title:
             self._update_save_item_and_title(True)
 
+    def _update_row(self, i):
+        model = self.table_model
+        if self._row_is_empty(i):
+            self._set_custom_font(i, self.DATE_COL_INDEX, self.EMPTY_ROW_COLOR)
+        else:
+            self._clear_custom_font(i, self.DATE_COL_INDEX)
+            origin = model.text(i, self.FROM_COL_INDEX)
+            dest = model.text(i, self.TO_COL_INDEX)
+            if origin and dest:
+                if origin.upper() == dest.upper():
+                    model.set_text(i, self.MILES_COL_INDEX, '0')
+                    self._set_custom_font(i, self.MILES_COL_INDEX, None, True)
+                    model.set_read_only(i, True)
+                else:
+                    dist = self._find_distance(origin, dest)
+                    if dist:
+                        model.set_text(i, self.MILES_COL_INDEX, str(dist))
+                        self._set_custom_font(i, self.MILES_COL_INDEX, None, True)
+                        model.set_read_only(i, True)
+                    else:
+                        if model.read_only[i]:
+                            model.set_text(i, self.MILES_COL_INDEX, '')
+                        self._clear_custom_font(i, self.MILES_COL_INDEX)
+                        model.set_read_only(i, False)
+            else:
+                model.set_read_only(i, False)
+                self._clear_custom_font(i, self.MILES_COL_INDEX)
+
 
 class SmilesApp(QApplication):
     """Subclass to allow event interception."""
 
-    def __init__(self, argv, data, settings, file_path):
+    def __init__(self, argv, settings, file_path):
         super().__init__(argv)
-        self.main_window = MainWindow(data, settings, file_path)
+        # Start loading the distances first so it overlaps with building the window. The signal
+        # is connected to this object so nothing is lost if loading finishes before the window
+        # exists; it's delivered once the event loop is running.
+        self.distance_loader = DistanceLoader(os.path.join(BASE_DIR, ARTIFACTS_DIR, DISTANCES_FILE),
+                                SettingsDialog.get_app_data_path(DISTANCES_CACHE_FILE), self)
+        self.distance_loader.loaded.connect(self._on_distances_loaded)
+        self.distance_loader.form_differences.connect(self._on_form_differences)
+        self.distance_loader.start()
+        self.aboutToQuit.connect(self.distance_loader.wait)
+        self.main_window = MainWindow(None, settings, file_path)
         self.main_window.show()
+        QTimer.singleShot(0, self.main_window.restore_autosave)
+
+    def _on_distances_loaded(self, data, completion_index, error):
+        self.main_window.set_distances(data, completion_index, error)
+
+    def _on_form_differences(self, differences):
+        self.main_window.show_form_differences(differences)
 
     def event(self, event: QEvent):
         """React to FileOpen events to enable double-clicking on documents."""
@@ -936,18 +1824,29 @@ class SmilesApp(QApplication):
 
 
 def main():
-    """Loads settings and the mileage data structure from the disk and shows the GUI."""
-    data = None
+    """Loads settings from the disk and shows the GUI while the mileage data is loaded."""
     settings = SettingsDialog.load_settings()
-    data = parse_distance_table(os.path.join(BASE_DIR, ARTIFACTS_DIR, DISTANCES_FILE))
 
     file_path = None
     if len(sys.argv) > 1:
         file_path = sys.argv[1]
 
-    app = SmilesApp(sys.argv, data, settings, file_path)
+    app = SmilesApp(sys.argv, settings, file_path)
     sys.exit(app.exec())
 
 
 if __name__ == "__main__":
+    # The --batch workers of a bundled app run this script again, see smiles_cli.fill_batch().
+    # It's only imported here because importing it takes longer than the rest of the standard
+    # library that the module needs.
+    import multiprocessing
+    multiprocessing.freeze_support()
+    # See profiling.py, nothing is wrapped unless --profile or SMILES_PROFILE was given.
+    import pdf_writer
+    profiling.install(sys.argv, [(sys.modules[__name__], 'main'),
+                                    (MainWindow, '_update_table'),
+                                    (MainWindow, '_create_pdf'),
+                                    (MainWindow, 'open_file'),
+                                    (sys.modules[__name__], 'fill_form'),
+                                    (pdf_writer, 'fill_form')])
     main()
@@ -0,0 +1,291 @@
+"""
+Fills in the mileage form from Smiles documents without starting the GUI. Nothing here imports Qt
+so it runs on machines without a display:
+
+    $ python3 smiles_cli.py --fill PATH-TO-DOCUMENT --out PATH-TO-PDF [--user-info SETTINGS]
+
+Whole directories of documents (or a manifest) can be filled in at once using a pool of processes:
+
+    $ python3 smiles_cli.py --batch DIRECTORY-OR-MANIFEST --out-dir DIRECTORY [--jobs N]
+
+A manifest is a JSON list of {"document": ..., "user_info": ..., "out": ...} objects where
+"user_info" is either a settings file or the settings themselves, and "out" is optional. Relative
+paths are relative to the manifest.
+
+Documents can also be converted to the compact binary form that loads long logs quickly, or back
+to a journal or the single JSON list that older versions of the app read:
+
+    $ python3 smiles_cli.py --convert PATH-TO-DOCUMENT [--format compact|journal|json] [--out PATH]
+
+
+Disclaimer of Warranty
+
+This software is provided "as is," without any warranties of any kind, either express or implied,
+including but not limited to the implied warranties of merchantability, fitness for a particular
+purpose, or non-infringement. The entire risk arising out of the use or performance of the software
+remains with you. In no event shall the software provider be liable for any direct, indirect,
+incidental, special, consequential, or punitive damages whatsoever arising out of or in connection
+with the use or inability to use the software.
+"""
+import sys
+import os
+import argparse
+import json
+import time
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+
+import app_data
+import rlm_document
+from pdf_parser import load_distance_table, DistanceIndex
+from pdf_writer import fill_form, preload_templates, use_form_widgets, format_grand_total
+
+
+__version__ = "1.1.0"
+__date__ = "Oct '26"
+
+CONVERT_FORMATS = ['compact', 'journal', 'json']
+
+
+def load_distances():
+    """Returns a DistanceIndex, sharing the GUI's cache of the parsed distance table."""
+    return DistanceIndex(load_distance_table(app_data.get_artifact_path(app_data.DISTANCES_FILE),
+                                app_data.get_app_data_path(app_data.DISTANCES_CACHE_FILE)))
+
+
+def load_form_widgets(stream=None):
+    """
+    Lets pdf_writer use the geometry of the fields in the forms themselves if they have them. Any
+    differences from widget_data are written to stream if it's specified.
+    """
+    differences = use_form_widgets(app_data.get_artifact_path(app_data.FORM_FILE),
+                    app_data.get_artifact_path(app_data.ADDITIONAL_FORM_FILE),
+                    app_data.get_app_data_path(app_data.FORM_WIDGETS_CACHE_FILE))
+    if stream and differences:
+        for difference in differences:
+            print(f"Form: {difference}", file=stream)
+    return differences
+
+
+def load_user_info(path=None):
+    """Returns the info for the top of the form with any missing settings left blank."""
+    return _complete_user_info(app_data.load_user_info(path))
+
+
+def _complete_user_info(user_info):
+    user_info = dict(user_info)
+    for setting in app_data.USER_INFO_SETTINGS:
+        user_info.setdefault(setting, '')
+    return user_info
+
+
+def fill_document(doc_path, out_path, user_info, distances):
+    """
+    Creates a PDF from a document the same way the GUI's 'Create PDF' button does. Returns the
+    statistics from fill_form().
+    """
+    table = rlm_document.prepare_table(rlm_document.read_document(doc_path), distances)
+    if not table:
+        raise ValueError("The document doesn't contain any useful data.")
+    return fill_form(app_data.get_artifact_path(app_data.FORM_FILE),
+                app_data.get_artifact_path(app_data.ADDITIONAL_FORM_FILE),
+                out_path,
+                {"USER_INFO": user_info, "TABLE": table})
+
+
+# Each worker process loads the distance table and the form templates once and reuses them for all
+# of its documents.
+_worker_distances = None
+
+
+def _init_worker():
+    global _worker_distances
+    _worker_distances = load_distances()
+    load_form_widgets()
+    preload_templates(app_data.get_artifact_path(app_data.FORM_FILE),
+                        app_data.get_artifact_path(app_data.ADDITIONAL_FORM_FILE))
+
+
+def _fill_job(job):
+    """Runs in a worker process. Returns (doc_path, out_path, seconds, stats, error_str)."""
+    doc_path, out_path, user_info = job
+    start = time.perf_counter()
+    try:
+        if isinstance(user_info, dict):
+            user_info = _complete_user_info(user_info)
+        else:
+            user_info = load_user_info(user_info)
+        stats = fill_document(doc_path, out_path, user_info, _worker_distances)
+    except Exception as e:
+        # A bad document shouldn't stop the rest of the batch.
+        return (doc_path, out_path, time.perf_counter() - start, None,
+                    f"{type(e).__name__}: {e}")
+    return (doc_path, out_path, time.perf_counter() - start, stats, None)
+
+
+def read_batch(source, out_dir, user_info):
+    """
+    Returns a list of (doc_path, out_path, user_info) jobs from a directory of documents or from
+    a manifest. user_info is used for documents that don't specify their own.
+    """
+    jobs = []
+    if os.path.isdir(source):
+        for name in sorted(os.listdir(source)):
+            if name.endswith(f".{app_data.APP_EXT}"):
+                out_path = os.path.join(out_dir or source, os.path.splitext(name)[0] + ".pdf")
+                jobs.append((os.path.join(source, name), out_path, user_info))
+        return jobs
+
+    base_dir = os.path.dirname(os.path.abspath(source))
+    with open(source, 'r', encoding='utf-8') as f:
+        entries = json.load(f)
+    for entry in entries:
+        doc_path = os.path.join(base_dir, entry['document'])
+        out_path = entry.get('out', None)
+        if out_path:
+            out_path = os.path.join(out_dir or base_dir, out_path)
+        else:
+            name = os.path.splitext(os.path.basename(doc_path))[0] + ".pdf"
+            out_path = os.path.join(out_dir or os.path.dirname(doc_path), name)
+        entry_info = entry.get('user_info', user_info)
+        if isinstance(entry_info, str):
+            entry_info = os.path.join(base_dir, entry_info)
+        jobs.append((doc_path, out_path, entry_info))
+    return jobs
+
+
+def fill_batch(jobs, max_workers=None, stream=sys.stdout):
+    """
+    Fills in the jobs using a pool of processes and writes a line to stream as each document
+    finishes. Returns the number of documents that failed.
+    """
+    start = time.perf_counter()
+    failures = 0
+    # Parse the distances and forms here first (if necessary) so the workers all find them in
+    # the cache, and only report the forms' differences once.
+    load_distances()
+    load_form_widgets(sys.stderr)
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker) as executor:
+        futures = {executor.submit(_fill_job, job): job for job in jobs}
+        for future in as_completed(futures):
+            try:
+                doc_path, out_path, seconds, stats, err = future.result()
+            except BrokenProcessPool as e:
+                # A worker couldn't start (e.g. _init_worker() failed) or died.
+                failures += 1
+                print(f"FAILED {futures[future][0]}: {type(e).__name__}: {e}", file=stream,
+                        flush=True)
+                continue
+            if err:
+                failures += 1
+                print(f"FAILED {doc_path}: {err} ({seconds:.2f}s)", file=stream, flush=True)
+            else:
+                print(f"OK {doc_path} -> {out_path} ({_format_stats(seconds, stats)})",
+                        file=stream, flush=True)
+    print(f"{len(jobs) - failures} created, {failures} failed in " +
+            f"{time.perf_counter() - start:.2f}s", file=stream, flush=True)
+    return failures
+
+
+def convert_document(doc_path, out_path, doc_format):
+    """Saves a document in one of the CONVERT_FORMATS. Returns the number of rows."""
+    rows = rlm_document.read_document(doc_path)
+    if doc_format == 'json':
+        with open(out_path, 'w', encoding='utf-8') as f:
+            json.dump(rows, f, indent=4)
+    else:
+        rlm_document.save_document(out_path, rows, binary=(doc_format == 'compact'))
+    return len(rows)
+
+
+def _format_stats(seconds, stats):
+    text = f"{seconds:.2f}s, {stats['layout_passes_saved']} layout passes saved"
+    if stats['form_sets'] > 1:
+        text += ", " + format_grand_total(stats['form_sets'], stats['parking_total'],
+                                            stats['miles_total'])
+    return text
+
+
+def _positive_int(value):
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"not a positive whole number: {value!r}")
+    return number
+
+
+def _build_arg_parser():
+    parser = argparse.ArgumentParser(prog=app_data.APP_NAME,
+        description="Create mileage reimbursement PDFs from documents without the GUI.")
+    mode = parser.add_mutually_exclusive_group(required=True)
+    mode.add_argument('--fill', metavar='DOCUMENT',
+        help=f"the .{app_data.APP_EXT} document to read")
+    mode.add_argument('--batch', metavar='SOURCE',
+        help=f"a directory of .{app_data.APP_EXT} documents or a JSON manifest")
+    mode.add_argument('--convert', metavar='DOCUMENT',
+        help=f"the .{app_data.APP_EXT} document to save in another --format")
+    parser.add_argument('--out', metavar='PATH',
+        help="where to save the PDF (defaults to the document's path with a .pdf extension) " +
+                "or the converted document (defaults to replacing it)")
+    parser.add_argument('--format', choices=CONVERT_FORMATS, default='compact',
+        help="the format to convert the document to (default: compact)")
+    parser.add_argument('--out-dir', metavar='DIRECTORY',
+        help="where to save the batch's PDFs (defaults to next to each document)")
+    parser.add_argument('--jobs', metavar='N', type=_positive_int,
+        help="the number of worker processes for a batch (defaults to the number of CPUs)")
+    parser.add_argument('--user-info', metavar='SETTINGS',
+        help="a settings file with the Name, Employee Number, etc. (defaults to the user's own)")
+    return parser
+
+
+def main(argv=None):
+    """Returns a process exit code."""
+    args = _build_arg_parser().parse_args(argv)
+    if args.batch:
+        try:
+            if args.out_dir and not os.path.exists(args.out_dir):
+                os.makedirs(args.out_dir)
+            jobs = read_batch(args.batch, args.out_dir, args.user_info or load_user_info())
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            print(f"{args.batch}: {e}", file=sys.stderr)
+            return 1
+        try:
+            failures = fill_batch(jobs, args.jobs)
+        except (OSError, ValueError, RuntimeError) as e:
+            # Loading the distances or forms failed before any document was filled in (fitz
+            # raises RuntimeErrors for PDFs that are missing or can't be read).
+            print(f"Can't fill in {args.batch}: {e}", file=sys.stderr)
+            return 1
+        return 1 if failures else 0
+
+    if args.convert:
+        out_path = args.out or args.convert
+        try:
+            count = convert_document(args.convert, out_path, args.format)
+        except (OSError, ValueError) as e:
+            print(f"{args.convert}: {e}", file=sys.stderr)
+            return 1
+        print(f"{args.convert} -> {out_path} ({count} rows, {args.format})")
+        return 0
+
+    start = time.perf_counter()
+    out_path = args.out
+    if not out_path:
+        out_path = os.path.splitext(args.fill)[0] + ".pdf"
+    try:
+        load_form_widgets(sys.stderr)
+        stats = fill_document(args.fill, out_path, load_user_info(args.user_info),
+                                load_distances())
+    except (OSError, ValueError, KeyError, IndexError, TypeError) as e:
+        print(f"{args.fill}: {e}", file=sys.stderr)
+        return 1
+    print(f"{args.fill} -> {out_path} ({_format_stats(time.perf_counter() - start, stats)})")
+    return 0
+
+
+if __name__ == "__main__":
+    multiprocessing.freeze_support()
+    sys.exit(main())
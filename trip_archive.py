@@ -0,0 +1,210 @@
+"""
+A local archive of the trips in any number of documents so they can be searched across files and
+years without opening them one by one, e.g. every trip to Sheldon in 2025:
+
+    archive = TripArchive(app_data.get_app_data_path(app_data.ARCHIVE_FILE))
+    archive.import_document("2025-03.rlm")
+    rows = list(archive.find_trips(start=date(2025, 1, 1), end=date(2025, 12, 31),
+                                    location="Sheldon"))
+
+The trips are kept in SQLite with indexes on the date, the From and To locations, and the
+purpose, so a query only reads the trips that it returns and they're returned one at a time.
+Names are compared without regard to case. The rows are in the document format so they can be
+written to the table or passed to fill_form(). Nothing here depends on Qt.
+
+
+Disclaimer of Warranty
+
+This software is provided "as is," without any warranties of any kind, either express or implied,
+including but not limited to the implied warranties of merchantability, fitness for a particular
+purpose, or non-infringement. The entire risk arising out of the use or performance of the software
+remains with you. In no event shall the software provider be liable for any direct, indirect,
+incidental, special, consequential, or punitive damages whatsoever arising out of or in connection
+with the use or inability to use the software.
+"""
+import os
+import sqlite3
+import calendar
+from datetime import date, datetime
+
+from rlm_document import (DATE_COL_INDEX, ROUND_TRIP_COL_INDEX, UPDATED_SCHOOL_NAMES,
+                            read_document, document_trips)
+
+
+__version__ = "1.0.0"
+__date__ = "Oct '26"
+
+SCHEMA_VERSION = 1
+
+# Dates are ISO strings so they sort (and can be read with the sqlite3 shell). Each trip remembers
+# its document and row so re-importing a document replaces its trips.
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    imported TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS trips (
+    id INTEGER PRIMARY KEY,
+    document_id INTEGER NOT NULL REFERENCES documents (id),
+    row INTEGER NOT NULL,
+    day TEXT NOT NULL,
+    origin TEXT NOT NULL COLLATE NOCASE,
+    dest TEXT NOT NULL COLLATE NOCASE,
+    purpose TEXT NOT NULL COLLATE NOCASE,
+    parking TEXT NOT NULL,
+    miles TEXT NOT NULL,
+    round_trip INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS trips_day ON trips (day);
+CREATE INDEX IF NOT EXISTS trips_origin ON trips (origin, day);
+CREATE INDEX IF NOT EXISTS trips_dest ON trips (dest, day);
+CREATE INDEX IF NOT EXISTS trips_purpose ON trips (purpose, day);
+CREATE INDEX IF NOT EXISTS trips_document ON trips (document_id);
+"""
+
+_TRIP_COLUMNS = "day, origin, dest, purpose, parking, miles, round_trip"
+
+
+def month_range(year, month):
+    """Returns the first and last dates of a month."""
+    return (date(year, month, 1), date(year, month, calendar.monthrange(year, month)[1]))
+
+
+def _trips(rows):
+    """Returns (row, day, origin, dest, purpose, parking, miles, round trip) for each trip."""
+    return [(i, day.isoformat(), *row[DATE_COL_INDEX + 1:ROUND_TRIP_COL_INDEX],
+                row[ROUND_TRIP_COL_INDEX] == '1')
+            for i, day, row in document_trips(rows)]
+
+
+def _where(start=None, end=None, location=None, origin=None, dest=None, purpose=None):
+    """Returns the WHERE clause (or '') and its parameters for the filters of find_trips()."""
+    clauses = []
+    params = []
+    if start:
+        clauses.append("day >= ?")
+        params.append(start.isoformat())
+    if end:
+        clauses.append("day <= ?")
+        params.append(end.isoformat())
+    # The trips use the full school names, see update_school_names().
+    location, origin, dest = (UPDATED_SCHOOL_NAMES.get(name, name)
+                                for name in (location, origin, dest))
+    if location:
+        clauses.append("(origin = ? OR dest = ?)")
+        params += [location, location]
+    for column, value in (('origin', origin), ('dest', dest), ('purpose', purpose)):
+        if value:
+            clauses.append(f"{column} = ?")
+            params.append(value)
+    if not clauses:
+        return ('', params)
+    return (" WHERE " + " AND ".join(clauses), params)
+
+
+class TripArchive:
+    """The archive in a SQLite file, which is created if it doesn't exist."""
+
+    def __init__(self, path):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        self.connection = sqlite3.connect(path)
+        version = self.connection.execute("PRAGMA user_version").fetchone()[0]
+        if version > SCHEMA_VERSION:
+            self.connection.close()
+            raise ValueError("The archive was created by a newer version.")
+        with self.connection:
+            self.connection.executescript(_SCHEMA)
+            self.connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def close(self):
+        """Closes the file."""
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def has_document(self, path):
+        """Returns True if the document at path was imported."""
+        return self.connection.execute("SELECT 1 FROM documents WHERE path = ?",
+                                        (os.path.abspath(path),)).fetchone() is not None
+
+    def import_document(self, path, force=False):
+        """
+        Adds the trips in a document, replacing the ones from an earlier import of the same file.
+        Returns the number of trips, or None if the file hasn't changed since it was last
+        imported (unless force is True).
+        """
+        path = os.path.abspath(path)
+        st = os.stat(path)
+        found = self.connection.execute("SELECT id, size, mtime_ns FROM documents WHERE path = ?",
+                                            (path,)).fetchone()
+        if found and not force and found[1:] == (st.st_size, st.st_mtime_ns):
+            return None
+        trips = _trips(read_document(path))
+        imported = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        with self.connection:
+            if found:
+                document_id = found[0]
+                self.connection.execute("DELETE FROM trips WHERE document_id = ?", (document_id,))
+                self.connection.execute(
+                    "UPDATE documents SET size = ?, mtime_ns = ?, imported = ? WHERE id = ?",
+                    (st.st_size, st.st_mtime_ns, imported, document_id))
+            else:
+                document_id = self.connection.execute(
+                    "INSERT INTO documents (path, size, mtime_ns, imported) VALUES (?, ?, ?, ?)",
+                    (path, st.st_size, st.st_mtime_ns, imported)).lastrowid
+            self.connection.executemany(
+                f"INSERT INTO trips (document_id, row, {_TRIP_COLUMNS}) " +
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [(document_id, *trip) for trip in trips])
+        return len(trips)
+
+    def remove_document(self, path):
+        """Removes a document's trips. Returns True if it had been imported."""
+        path = os.path.abspath(path)
+        with self.connection:
+            found = self.connection.execute("SELECT id FROM documents WHERE path = ?",
+                                                (path,)).fetchone()
+            if not found:
+                return False
+            self.connection.execute("DELETE FROM trips WHERE document_id = ?", found)
+            self.connection.execute("DELETE FROM documents WHERE id = ?", found)
+        return True
+
+    def documents(self):
+        """Returns (path, number of trips, time imported) for each document, by path."""
+        return self.connection.execute(
+            "SELECT path, (SELECT COUNT(*) FROM trips WHERE document_id = documents.id), " +
+                "imported FROM documents ORDER BY path").fetchall()
+
+    def find_trips(self, start=None, end=None, location=None, origin=None, dest=None,
+                    purpose=None, limit=None):
+        """
+        Yields the rows of the trips between the start and end dates (inclusive) that match
+        the other filters, in order by date. location matches either From or To. Any filter
+        that's None isn't used.
+        """
+        where, params = _where(start, end, location, origin, dest, purpose)
+        sql = f"SELECT {_TRIP_COLUMNS} FROM trips{where} ORDER BY day, document_id, row"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        for day, origin, dest, purpose, parking, miles, round_trip in \
+                self.connection.execute(sql, params):
+            yield [f"{day[5:7]}/{day[8:10]}/{day[:4]}", origin, dest, purpose, parking, miles,
+                    '1' if round_trip else '0']
+
+    def count_trips(self, start=None, end=None, location=None, origin=None, dest=None,
+                    purpose=None):
+        """Returns the number of trips that find_trips() would return."""
+        where, params = _where(start, end, location, origin, dest, purpose)
+        return self.connection.execute(f"SELECT COUNT(*) FROM trips{where}", params).fetchone()[0]
@@ -0,0 +1,235 @@
+"""
+Learns which purposes and routes the user actually uses from the documents that they open and
+save, so the completers can suggest those first and the likely To location can be suggested from
+the From location. Nothing here depends on Qt.
+
+Each trip adds to the score of its purpose and route, and the amount doubles every HALF_LIFE_DAYS
+so a trip from this month counts for more than the same trip a year ago. Since a trip's weight
+only depends on its own date, the scores never need to be aged and each document's share can be
+replaced when it's saved again without looking at the others. The shares are kept in a small JSON
+cache next to the settings file (see load() and save()).
+
+
+Disclaimer of Warranty
+
+This software is provided "as is," without any warranties of any kind, either express or implied,
+including but not limited to the implied warranties of merchantability, fitness for a particular
+purpose, or non-infringement. The entire risk arising out of the use or performance of the software
+remains with you. In no event shall the software provider be liable for any direct, indirect,
+incidental, special, consequential, or punitive damages whatsoever arising out of or in connection
+with the use or inability to use the software.
+"""
+import os
+import json
+import time
+import functools
+from datetime import date
+
+from completion_index import normalize
+from rlm_document import (FROM_COL_INDEX, TO_COL_INDEX, PURPOSE_COL_INDEX, document_trips,
+                            replace_file)
+
+
+__version__ = "1.0.0"
+__date__ = "Oct '26"
+
+CACHE_VERSION = 1
+HALF_LIFE_DAYS = 90
+EPOCH = date(2020, 1, 1).toordinal()
+# Trips more than this many half-lives from EPOCH (centuries away, but the dates can be typed in)
+# all weigh the same so the weights stay finite and above zero.
+MAX_HALF_LIVES = 900
+
+# Only the documents that were saved most recently are remembered.
+MAX_DOCUMENTS = 50
+
+# Scores are rounded to this many significant digits so the cache stays small.
+SCORE_DIGITS = 6
+
+# The same few names are looked up over and over.
+_key = functools.lru_cache(maxsize=4096)(normalize)
+
+
+def trip_weight(day):
+    """Returns how much a trip on day (a date ordinal) adds to the scores."""
+    half_lives = (day - EPOCH) / HALF_LIFE_DAYS
+    return 2.0 ** max(-MAX_HALF_LIVES, min(half_lives, MAX_HALF_LIVES))
+
+
+def _round(score):
+    return float(f"{score:.{SCORE_DIGITS}g}")
+
+
+class RankedNames:
+    """
+    Names with scores, best first. Names are the same if they only differ by case, accents, or
+    spacing; the most recently added spelling is the one that's shown. Defaults have no score and
+    come after every name that does, in their original order.
+    """
+
+    def __init__(self, defaults=()):
+        self.scores = {}
+        self.names = {}
+        self.defaults = {}
+        for name in defaults:
+            key = _key(name)
+            if key and key not in self.defaults:
+                self.defaults[key] = len(self.defaults)
+                self.names[key] = name
+        self._ranked = None
+
+    def __len__(self):
+        return len(self.names)
+
+    def add(self, name, score):
+        """Adds to (or with a negative score, takes away from) the score of name."""
+        key = _key(name)
+        if not key:
+            return
+        total = self.scores.get(key, 0.0) + score
+        # Taking away everything that was added only leaves rounding errors.
+        if total <= abs(score) * 1e-9:
+            self.scores.pop(key, None)
+            if key not in self.defaults:
+                self.names.pop(key, None)
+        else:
+            self.scores[key] = total
+            if score > 0:
+                self.names[key] = name
+        self._ranked = None
+
+    def _rank(self):
+        if self._ranked is None:
+            keys = sorted(self.names, key=lambda k: (-self.scores.get(k, 0.0),
+                                                        self.defaults.get(k, len(self.defaults)),
+                                                        k))
+            self._ranked = [(k, ' ' + k, self.names[k]) for k in keys]
+        return self._ranked
+
+    def ranked(self, limit=None):
+        """Returns the names, best first."""
+        return [name for _, _, name in self._rank()[:limit]]
+
+    def matches(self, text, limit=None):
+        """
+        Returns the names that start with text or have a word that does, best first. At most
+        limit names are returned if it's specified. This is the same interface as
+        CompletionIndex.matches() so either can be used by the completers.
+        """
+        query = normalize(text)
+        if not query:
+            return self.ranked(limit)
+        word = ' ' + query
+        result = []
+        for _, spaced, name in self._rank():
+            if word in spaced:
+                result.append(name)
+                if len(result) == limit:
+                    break
+        return result
+
+
+def _document_scores(rows):
+    """Returns ({purpose: score}, {origin: {dest: score}}) for the trips in a document's rows."""
+    purposes = {}
+    routes = {}
+    for _, day, row in document_trips(rows):
+        weight = trip_weight(day.toordinal())
+        purpose = row[PURPOSE_COL_INDEX].strip()
+        if purpose:
+            purposes[purpose] = purposes.get(purpose, 0.0) + weight
+        origin = row[FROM_COL_INDEX].strip()
+        dest = row[TO_COL_INDEX].strip()
+        if origin and dest:
+            dests = routes.setdefault(origin, {})
+            dests[dest] = dests.get(dest, 0.0) + weight
+    purposes = {purpose: _round(score) for purpose, score in purposes.items()}
+    routes = {origin: {dest: _round(score) for dest, score in dests.items()}
+                for origin, dests in routes.items()}
+    return (purposes, routes)
+
+
+class TripHistory:
+    """The ranked purposes, From locations, and To locations for each From location."""
+
+    def __init__(self, default_purposes=()):
+        self.purposes = RankedNames(default_purposes)
+        self.origins = RankedNames()
+        self.destinations = {}
+        # The share of the scores from each document, by its absolute path.
+        self.documents = {}
+
+    def _apply(self, document, sign):
+        for purpose, score in document['purposes'].items():
+            self.purposes.add(purpose, sign * score)
+        for origin, dests in document['routes'].items():
+            key = _key(origin)
+            ranked = self.destinations.get(key)
+            if ranked is None:
+                ranked = self.destinations[key] = RankedNames()
+            for dest, score in dests.items():
+                self.origins.add(origin, sign * score)
+                ranked.add(dest, sign * score)
+            if not ranked:
+                del self.destinations[key]
+
+    def update_document(self, path, rows, stamp=None):
+        """
+        Replaces the share of a document's trips with the trips in rows. stamp is anything that
+        changes when the file does (e.g. its size and modification time); nothing is done if
+        it's the same as last time. Returns True if anything changed.
+        """
+        path = os.path.abspath(path)
+        old = self.documents.get(path)
+        if old is not None and stamp is not None and old.get('stamp') == list(stamp):
+            return False
+        purposes, routes = _document_scores(rows)
+        document = {'stamp': list(stamp) if stamp is not None else None, 'saved': time.time(),
+                    'purposes': purposes, 'routes': routes}
+        if old is not None:
+            self._apply(old, -1)
+        self._apply(document, 1)
+        self.documents[path] = document
+
+        if len(self.documents) > MAX_DOCUMENTS:
+            oldest = min(self.documents, key=lambda p: self.documents[p]['saved'])
+            self._apply(self.documents.pop(oldest), -1)
+        return True
+
+    def purpose_matches(self, text, limit=None):
+        """Returns the purposes that match text, the ones used most and most recently first."""
+        return self.purposes.matches(text, limit)
+
+    def likely_destinations(self, origin, limit=None):
+        """Returns the To locations of the trips from origin, the most likely first."""
+        ranked = self.destinations.get(_key(origin))
+        return ranked.ranked(limit) if ranked else []
+
+    def likely_origins(self, limit=None):
+        """Returns the From locations, the most used first."""
+        return self.origins.ranked(limit)
+
+    def save(self, path):
+        """Writes the cache, replacing the file all at once so it's never partially written."""
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        data = json.dumps({'version': CACHE_VERSION, 'documents': self.documents},
+                            ensure_ascii=False, separators=(',', ':'))
+        replace_file(path, data.encode('utf-8'))
+
+    @classmethod
+    def load(cls, path, default_purposes=()):
+        """Returns the history in the cache at path, or an empty one if it can't be read."""
+        history = cls(default_purposes)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') != CACHE_VERSION:
+                return history
+            for doc_path, document in data['documents'].items():
+                history._apply(document, 1)
+                history.documents[doc_path] = document
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            return cls(default_purposes)
+        return history